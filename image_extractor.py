@@ -8,6 +8,48 @@ import os
 import io
 from pathlib import Path
 
+# Quality ratings by minimum DPI, highest first
+_QUALITY_BUCKETS = (
+    (600, "Excellent (Print Ready)"),
+    (300, "Very Good (Print Quality)"),
+    (200, "Good (Web/Screen)"),
+    (150, "Fair (Low Print)"),
+)
+
+
+def get_quality_rating(dpi):
+    """Get quality rating based on DPI"""
+    for threshold, label in _QUALITY_BUCKETS:
+        if dpi >= threshold:
+            return label
+    return "Poor (Screen Only)"
+
+
+# A shared render of a page's crops is only used while the covering area is at most this
+# many times the crops' total area; farther apart crops are rendered one by one
+_SHARED_RENDER_MAX_OVERHEAD = 2.0
+
+# Documents opened by pool worker processes, path -> (mtime, document); one parse per process
+_worker_docs = {}
+
+
+def _get_worker_document(pdf_path):
+    """Get the memoized open document of pdf_path in this process, reopening it if the file changed"""
+    mtime = os.path.getmtime(pdf_path)
+    cached = _worker_docs.get(pdf_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    # Workers serve one document at a time, so close documents of earlier files
+    for _, pdf_document in _worker_docs.values():
+        pdf_document.close()
+    _worker_docs.clear()
+    
+    pdf_document = fitz.open(pdf_path)
+    _worker_docs[pdf_path] = (mtime, pdf_document)
+    return pdf_document
+
+
 class ImageExtractor:
     """Class for extracting high-quality images from PDF documents"""
     
@@ -33,8 +75,6 @@ class ImageExtractor:
         """
         try:
             page_num = crop_data['page']
-            coords = crop_data['coords']  # (left, top, right, bottom) in display coordinates
-            display_zoom = crop_data['zoom']
             
             # Get the PDF page
             page = self.pdf_document[page_num]
@@ -50,36 +90,8 @@ class ImageExtractor:
             # No caps or limits - preserve the exact quality of the source
             extraction_scale = native_scale
             
-            # Get actual output dimensions for verification
-            crop_width = coords[2] - coords[0]  # in display pixels
-            crop_height = coords[3] - coords[1]  # in display pixels
-            
-            # Get page dimensions for coordinate validation
-            page_rect = page.rect
-            
-            # Use pre-calculated PDF coordinates if available (new format)
-            if 'pdf_coords' in crop_data:
-                pdf_left, pdf_top, pdf_right, pdf_bottom = crop_data['pdf_coords']
-            else:
-                # Fallback: convert display coordinates to PDF coordinates (legacy format)
-                display_render_scale = display_zoom * 2.0
-                pdf_left = coords[0] / display_render_scale
-                pdf_top = coords[1] / display_render_scale  
-                pdf_right = coords[2] / display_render_scale
-                pdf_bottom = coords[3] / display_render_scale
-            
-            # Ensure coordinates are within page bounds
-            pdf_left = max(0, min(pdf_left, page_rect.width))
-            pdf_top = max(0, min(pdf_top, page_rect.height))
-            pdf_right = max(pdf_left + 1, min(pdf_right, page_rect.width))
-            pdf_bottom = max(pdf_top + 1, min(pdf_bottom, page_rect.height))
-            
-            # Create clip rectangle in PDF coordinates
-            clip_rect = fitz.Rect(pdf_left, pdf_top, pdf_right, pdf_bottom)
-            
-            # Validate the clip rectangle
-            if clip_rect.is_empty or clip_rect.width < 1 or clip_rect.height < 1:
-                raise ValueError("Invalid crop rectangle dimensions")
+            # Clip rectangle in PDF coordinates, validated against the page bounds
+            clip_rect = self._get_clip_rect(crop_data, page_rect)
             
             # Create transformation matrix for high-resolution rendering
             matrix = fitz.Matrix(extraction_scale, extraction_scale)
@@ -120,40 +132,7 @@ class ImageExtractor:
                 pix = None  # Clean up
                 raise ValueError(f"Failed to convert pixmap to image: {conversion_error}")
             
-            # Calculate actual DPI achieved
-            actual_dpi = int(72 * extraction_scale)
-            
-            # Calculate physical dimensions at this DPI
-            width_inches = pil_image.width / actual_dpi
-            height_inches = pil_image.height / actual_dpi
-            
-            # Add extraction metadata to image
-            metadata = {
-                'extraction_dpi': actual_dpi,
-                'native_scale': native_scale,
-                'width_pixels': pil_image.width,
-                'height_pixels': pil_image.height,
-                'width_inches': round(width_inches, 3),
-                'height_inches': round(height_inches, 3),
-                'page_number': page_num + 1,
-                'extraction_scale': round(extraction_scale, 2),
-                'source_quality': 'Maximum Available from PDF'
-            }
-            
-            # Always use PNG format - preserves exact DPI and quality without compression artifacts
-            # Ensure output path has .png extension
-            if not output_path.lower().endswith('.png'):
-                output_path = output_path.rsplit('.', 1)[0] + '.png'
-            
-            pil_image.save(
-                output_path,
-                "PNG",
-                dpi=(actual_dpi, actual_dpi),
-                optimize=True,  # PNG optimization without quality loss
-                compress_level=6  # Moderate compression for reasonable file size
-            )
-            
-            return metadata
+            return self._save_crop_image(pil_image, output_path, extraction_scale, native_scale, page_num)
             
         except Exception as e:
             print(f"Error extracting crop: {str(e)}")
@@ -163,6 +142,147 @@ class ImageExtractor:
             except:
                 return None
     
+    def extract_page_crops(self, crop_items):
+        """
+        Extract several crops of the same page from a single render
+        
+        The page is rendered once at its native scale over the union of the
+        crop areas and each crop is sliced from that image. Crops spread far
+        apart (e.g. in opposite corners) would make that union close to the
+        whole page, so they are rendered one by one instead.
+        
+        Args:
+            crop_items: List of (crop_data, output_path) tuples, all on one page
+            
+        Returns:
+            list: Extraction metadata (None on failure) for each item, in order
+        """
+        if len(crop_items) == 1:
+            return [self.extract_crop(*crop_items[0])]
+        
+        try:
+            page_num = crop_items[0][0]['page']
+            page = self.pdf_document[page_num]
+            native_scale = self._get_page_native_scale(page)
+            matrix = fitz.Matrix(native_scale, native_scale)
+            
+            # Render the smallest area covering every crop
+            clip_rects = [self._get_clip_rect(crop_data, page.rect) for crop_data, _ in crop_items]
+            union_rect = fitz.Rect(clip_rects[0])
+            for clip_rect in clip_rects[1:]:
+                union_rect.include_rect(clip_rect)
+            
+            # Not worth it when the union is mostly area between the crops
+            crops_area = sum(clip_rect.width * clip_rect.height for clip_rect in clip_rects)
+            if union_rect.width * union_rect.height > _SHARED_RENDER_MAX_OVERHEAD * crops_area:
+                return [self.extract_crop(crop_data, output_path) for crop_data, output_path in crop_items]
+            
+            pix = page.get_pixmap(matrix=matrix, clip=union_rect)
+            if pix.width == 0 or pix.height == 0:
+                raise ValueError("Generated pixmap has zero dimensions")
+            page_image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        except Exception as e:
+            print(f"Shared page render failed, extracting crops one by one: {e}")
+            return [self.extract_crop(crop_data, output_path) for crop_data, output_path in crop_items]
+        
+        results = []
+        for (crop_data, output_path), clip_rect in zip(crop_items, clip_rects):
+            try:
+                # Crop box in pixels relative to the rendered area
+                box = (clip_rect * matrix).irect
+                pil_image = page_image.crop((box.x0 - pix.x, box.y0 - pix.y, box.x1 - pix.x, box.y1 - pix.y))
+                results.append(self._save_crop_image(pil_image, output_path, native_scale, native_scale, page_num))
+            except Exception as e:
+                print(f"Error slicing crop from page render: {e}")
+                results.append(self.extract_crop(crop_data, output_path))
+        return results
+    
+    def _get_clip_rect(self, crop_data, page_rect):
+        """
+        Get a crop's clip rectangle in PDF coordinates, clamped to the page
+        
+        Args:
+            crop_data: Dictionary containing page, coords, and zoom info
+            page_rect: Rectangle of the crop's page
+            
+        Returns:
+            fitz.Rect: Clip rectangle in PDF coordinates
+        """
+        # Use pre-calculated PDF coordinates if available (new format)
+        if 'pdf_coords' in crop_data:
+            pdf_left, pdf_top, pdf_right, pdf_bottom = crop_data['pdf_coords']
+        else:
+            # Fallback: convert display coordinates to PDF coordinates (legacy format)
+            coords = crop_data['coords']
+            display_render_scale = crop_data['zoom'] * 2.0
+            pdf_left = coords[0] / display_render_scale
+            pdf_top = coords[1] / display_render_scale  
+            pdf_right = coords[2] / display_render_scale
+            pdf_bottom = coords[3] / display_render_scale
+        
+        # Ensure coordinates are within page bounds
+        pdf_left = max(0, min(pdf_left, page_rect.width))
+        pdf_top = max(0, min(pdf_top, page_rect.height))
+        pdf_right = max(pdf_left + 1, min(pdf_right, page_rect.width))
+        pdf_bottom = max(pdf_top + 1, min(pdf_bottom, page_rect.height))
+        
+        # Create clip rectangle in PDF coordinates
+        clip_rect = fitz.Rect(pdf_left, pdf_top, pdf_right, pdf_bottom)
+        
+        # Validate the clip rectangle
+        if clip_rect.is_empty or clip_rect.width < 1 or clip_rect.height < 1:
+            raise ValueError("Invalid crop rectangle dimensions")
+        return clip_rect
+    
+    def _save_crop_image(self, pil_image, output_path, extraction_scale, native_scale, page_num):
+        """
+        Save an extracted crop as PNG with its DPI and build its metadata
+        
+        Args:
+            pil_image: Extracted crop image
+            output_path: Path to save the extracted image
+            extraction_scale: Scale the crop was rendered at
+            native_scale: Native scale of the page
+            page_num: Page number (0-based)
+            
+        Returns:
+            dict: Extraction metadata
+        """
+        # Calculate actual DPI achieved
+        actual_dpi = int(72 * extraction_scale)
+        
+        # Calculate physical dimensions at this DPI
+        width_inches = pil_image.width / actual_dpi
+        height_inches = pil_image.height / actual_dpi
+        
+        # Add extraction metadata to image
+        metadata = {
+            'extraction_dpi': actual_dpi,
+            'native_scale': native_scale,
+            'width_pixels': pil_image.width,
+            'height_pixels': pil_image.height,
+            'width_inches': round(width_inches, 3),
+            'height_inches': round(height_inches, 3),
+            'page_number': page_num + 1,
+            'extraction_scale': round(extraction_scale, 2),
+            'source_quality': 'Maximum Available from PDF'
+        }
+        
+        # Always use PNG format - preserves exact DPI and quality without compression artifacts
+        # Ensure output path has .png extension
+        if not output_path.lower().endswith('.png'):
+            output_path = output_path.rsplit('.', 1)[0] + '.png'
+        
+        pil_image.save(
+            output_path,
+            "PNG",
+            dpi=(actual_dpi, actual_dpi),
+            optimize=True,  # PNG optimization without quality loss
+            compress_level=6  # Moderate compression for reasonable file size
+        )
+        
+        return metadata
+    
     def _emergency_extraction_fallback(self, crop_data, output_path):
         """
         Emergency fallback extraction for problematic content
@@ -454,16 +574,7 @@ class ImageExtractor:
         
     def _get_quality_rating(self, dpi):
         """Get quality rating based on DPI"""
-        if dpi >= 600:
-            return "Excellent (Print Ready)"
-        elif dpi >= 300:
-            return "Very Good (Print Quality)"
-        elif dpi >= 200:
-            return "Good (Web/Screen)"
-        elif dpi >= 150:
-            return "Fair (Low Print)"
-        else:
-            return "Poor (Screen Only)"
+        return get_quality_rating(dpi)
             
     def get_page_info(self, page_num):
         """
@@ -598,3 +709,40 @@ class ImageExtractor:
         except Exception as e:
             print(f"Error generating crop preview: {str(e)}")
             return None
+
+
+def extract_page_crops_from_file(pdf_path, crop_items):
+    """
+    Extract crops of one page from a PDF file opened in the calling process
+    
+    Used by the export process pool, since open documents cannot be pickled.
+    The document stays open in the worker for later calls on the same file.
+    
+    Args:
+        pdf_path: Path of the PDF file
+        crop_items: List of (crop_data, output_path) tuples, all on one page
+        
+    Returns:
+        list: True for each crop that was extracted successfully, False otherwise
+    """
+    pdf_document = _get_worker_document(pdf_path)
+    return [bool(metadata) for metadata in ImageExtractor(pdf_document).extract_page_crops(crop_items)]
+
+
+def extract_crop_from_file(pdf_path, crop_data, output_path):
+    """
+    Extract a single crop from a PDF file opened in the calling process
+    
+    Used by the individual save process pool, since open documents cannot be pickled.
+    The document stays open in the worker for later calls on the same file.
+    
+    Args:
+        pdf_path: Path of the PDF file
+        crop_data: Dictionary containing page, coords, and zoom info
+        output_path: Path to save the extracted image
+        
+    Returns:
+        dict: Extraction metadata, or None if extraction failed
+    """
+    pdf_document = _get_worker_document(pdf_path)
+    return ImageExtractor(pdf_document).extract_crop(crop_data, output_path)
@@ -7,6 +7,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
+import multiprocessing
 
 from pdf_viewer import PDFViewerApp
 
@@ -43,4 +44,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Export worker processes must not start the GUI in frozen Windows builds
+    multiprocessing.freeze_support()
     main()
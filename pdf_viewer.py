@@ -3,31 +3,103 @@ PDF Viewer Component - Main UI and PDF Display Logic
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import ttk, filedialog, messagebox
 import fitz  # PyMuPDF
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import os
-import io
+import re
 import threading
+import time
+import queue
+import bisect
+import atexit
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import socket
+import stat
+import urllib.error
 import urllib.request
 import urllib.parse
 import tempfile
-import shutil
+import getpass
+import hashlib
+import json
+from collections import OrderedDict
 from pathlib import Path
 
 from ui_components import CropFrame, NamingFrame, ControlFrame
-from image_extractor import ImageExtractor
-from utils import format_file_size, get_pdf_info, get_unique_filename
+from image_extractor import ImageExtractor, extract_crop_from_file, extract_page_crops_from_file, get_quality_rating
+from utils import UniqueNamer, compile_naming_pattern, format_file_size, get_pdf_info, get_unique_filename, log_error
+
+# Rendered pages are kept on disk across sessions, keyed by document content, in a directory private to the user
+DISK_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(), f"pdfcroptool_cache-{os.getuid() if hasattr(os, 'getuid') else getpass.getuser()}"
+)
+DISK_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DISK_CACHE_MIN_RENDER_SECONDS = 0.05  # Faster renders beat a PNG decode, so those pages are not cached
+
+# Worker processes are spawned on every platform; forking this multi-threaded Tk process
+# could copy a lock held by another thread into the child and deadlock it
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+# Digit runs in crop names, used to learn naming patterns from renames
+_DIGITS_RE = re.compile(r'\d+')
+
+# Google Drive file ID in /file/d/<id>, open?id=<id> and uc?...id=<id> share links
+_GDRIVE_RE = re.compile(r'drive\.google\.com/(?:file/d/|open\?id=|uc\?(?:[^&]*&)*id=)([A-Za-z0-9_-]+)')
+
+# Rewrites of other Google Drive /view links to PDF export, most specific first
+_DRIVE_VIEW_REWRITES = (
+    ("/view?usp=sharing", "/export?format=pdf"),
+    ("/view?usp=drivesdk", "/export?format=pdf"),
+    ("/view", "/export?format=pdf"),
+)
+
+# URL downloads are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Seconds a connect or read may block before the download is abandoned
+DOWNLOAD_TIMEOUT = 30
+
+# Export manifest in the output directory, mapping exported filenames to crop content keys
+EXPORT_MANIFEST_NAME = ".crop_manifest.json"
+
+# Learned naming patterns, keyed by PDF filename (full URL for downloads), kept across sessions
+NAMING_PATTERNS_PATH = os.path.join(os.path.expanduser("~"), ".pdfcroptool", "naming_patterns.json")
 
 class PDFViewerApp:
     def __init__(self, root):
         self.root = root
         self.pdf_document = None
+        self.extractor = None  # ImageExtractor shared by all saves/exports of the current document
+        self._cached_metadata = {}  # Metadata of the current document, read once on load
         self.current_page = 0
         self.zoom_level = 1.0
-        self.pdf_images = []  # Cache for rendered pages
+        self.page_images = {}  # Continuous mode: page number -> PhotoImage on screen
+        self._page_cache = OrderedDict()  # LRU of (page, zoom) -> rendered PIL page image
+        self.current_image = None  # PhotoImage shown in single page mode, reused across pages
+        self._page_item = None  # Canvas image item showing the page in single page mode
+        self.page_cache_size = 20  # Maximum number of rendered pages kept in the LRU
+        
+        self._render_lock = threading.Lock()  # Serializes PyMuPDF use of the open document across threads
+        self._prefetch_after = None  # Pending after_idle id of the neighbour prefetch
+        self._visible_after = None  # Pending after_idle id of the coalesced viewport render
+        
+        # Disk cache of rendered pages; hashing, PNG writes and trimming run on one background thread
+        self._disk_cache_dir = None  # Disk cache directory of the current document
+        self._cache_pool = ThreadPoolExecutor(max_workers=1)
+        atexit.register(self._cache_pool.shutdown, wait=False, cancel_futures=True)
+        self._save_pool = None  # Process pool for individual crop saves, created on first save
+        
+        # One long-lived thread runs save jobs instead of a new thread per job
+        self._io_queue = queue.Queue()
+        threading.Thread(target=self._io_worker, daemon=True).start()
         self.crop_selections = []  # List of crop selections
         self.output_directory = ""
+        self._preflight_listdir = None  # (directory, mtime_ns, names) listed in the background after selection
+        self._export_manifest = {}  # Manifest entries of the export in progress
+        self._export_unchanged_count = 0  # Crops of the export in progress already up to date on disk
+        self._info_last_path = None  # File currently described in the PDF info panel
+        self._info_last_mtime = None
         self.naming_pattern = "Q{:02d}"
         self.use_sequential_naming = False
         
@@ -35,6 +107,10 @@ class PDFViewerApp:
         self.learned_naming_prefix = ""  # Learned prefix from user renaming (e.g., "nima_")
         self.learned_naming_pattern = ""  # Full learned pattern (e.g., "nima_Q{:02d}")
         self.naming_learning_enabled = True
+        self._rename_after_id = None  # Pending propagation of a learned pattern to later crops
+        self._rename_from_index = None  # Earliest renamed crop waiting for propagation
+        self._pattern_cache = self._load_naming_patterns()  # PDF filename -> learned naming pattern
+        self._pattern_key = None  # Filename the current document's pattern is stored under
         
         # Continuous scrolling system
         self.continuous_mode = False  # Disable continuous scrolling by default
@@ -42,6 +118,12 @@ class PDFViewerApp:
         self.page_heights = []   # Height of each page
         self.total_height = 0    # Total height of all pages
         self.page_gap = 20       # Gap between pages in continuous mode
+        self._nav_state = {}     # Last options applied to each navigation widget
+        self._crop_pages_drawn = None  # Pages whose saved crops are on the canvas in continuous mode
+        self._suppress_redraw = False  # Defer saved crop redraws while a batch update runs
+        self._redraw_dirty = False  # A crop redraw was requested during the batch
+        self._crop_items = []  # Pool of (rectangle, label) canvas items reused for saved crops
+        self._crop_item_of = {}  # Crop index -> (rectangle, label) items it was last drawn with
         
         # Search system removed - only keeping visualization highlighting
         
@@ -53,6 +135,9 @@ class PDFViewerApp:
                            'schema', 'Schema', 'flowchart', 'Flowchart', 'map', 'Map',
                            'screenshot', 'Screenshot', 'photo', 'Photo', 'visual', 'Visual']
         self.viz_highlights = []  # List of visualization highlight rectangles
+        self._viz_overlays = []  # PhotoImages of the drawn highlight overlays (one per page)
+        self._search_cache = {}  # (page, keyword) -> search_for results for the current document
+        self._viz_scanned_pages = None  # Pages covered by the current viz highlights
         self.show_viz_highlights = False  # Control viz highlighting with checkbox (OFF by default)
         
         self.setup_ui()
@@ -100,43 +185,10 @@ class PDFViewerApp:
         self.left_panel.bind("<Configure>", _configure_scroll_region)
         self.left_canvas.bind("<Configure>", _configure_scroll_region)
         
-        # Enhanced mouse wheel scrolling for left panel
-        def _on_left_mousewheel(event):
-            try:
-                # Handle different platforms (Windows uses event.delta, Linux uses event.num)
-                if event.delta:
-                    delta = int(-1 * (event.delta / 120))
-                elif event.num == 4:
-                    delta = -1
-                elif event.num == 5:
-                    delta = 1
-                else:
-                    return
-                
-                # Scroll the left canvas
-                self.left_canvas.yview_scroll(delta, "units")
-                return "break"
-            except Exception:
-                pass
-        
-        # Bind mousewheel to all left panel components recursively
-        def bind_mousewheel_recursive(widget):
-            widget.bind("<MouseWheel>", _on_left_mousewheel)  # Windows
-            widget.bind("<Button-4>", _on_left_mousewheel)    # Linux scroll up
-            widget.bind("<Button-5>", _on_left_mousewheel)    # Linux scroll down
-            
-            # Bind to all children
-            for child in widget.winfo_children():
-                try:
-                    bind_mousewheel_recursive(child)
-                except:
-                    pass
-        
-        # Initially bind to frame, then refresh after components are created
-        bind_mousewheel_recursive(self.left_scroll_frame)
-        
-        # Store the binding function for later use
-        self._bind_mousewheel_recursive = bind_mousewheel_recursive
+        # One application-wide mouse wheel binding, routed to the panel under the cursor
+        self.root.bind_all("<MouseWheel>", self._global_mousewheel)  # Windows
+        self.root.bind_all("<Button-4>", self._global_mousewheel)    # Linux scroll up
+        self.root.bind_all("<Button-5>", self._global_mousewheel)    # Linux scroll down
         
         # Right panel for PDF display
         self.right_panel = ttk.Frame(self.main_frame)
@@ -177,6 +229,9 @@ class PDFViewerApp:
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
         # Zoom commands removed - functionality disabled to fix display issues
+        self.show_quality_var = tk.BooleanVar(value=True)
+        view_menu.add_checkbutton(label="Show Crop Quality", variable=self.show_quality_var,
+                                  command=lambda: self.crop_frame.set_show_quality(self.show_quality_var.get()))
         
         # Tools menu
         tools_menu = tk.Menu(menubar, tearoff=0)
@@ -231,6 +286,8 @@ class PDFViewerApp:
         
         # Page input with validation
         self.page_var = tk.StringVar()
+        self._pending_page_after = None
+        self._page_entry_fg = "black"  # Text color currently applied to the page entry
         self.page_var.trace('w', self.on_page_input_change)
         self.page_entry = ttk.Entry(page_input_frame, textvariable=self.page_var, width=8, justify=tk.CENTER)
         self.page_entry.pack(side=tk.LEFT, padx=(5, 5))
@@ -279,10 +336,6 @@ class PDFViewerApp:
         
         ttk.Button(export_frame, text="Export All Crops", 
                   command=self.export_all_crops, style="Accent.TButton").pack(fill=tk.X, pady=(10, 2))
-        
-        # Refresh mouse wheel bindings after all components are created
-        if hasattr(self, '_bind_mousewheel_recursive'):
-            self._bind_mousewheel_recursive(self.left_scroll_frame)
     
     def setup_highlighting_controls(self):
         """Setup the highlighting and view controls in the right panel"""
@@ -313,14 +366,16 @@ class PDFViewerApp:
         # Canvas with scrollbars
         self.canvas = tk.Canvas(canvas_frame, bg="white")
         
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
         
-        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        # Vertical scroll changes also drive which pages are rasterized in continuous mode
+        self.canvas.configure(yscrollcommand=self._on_canvas_yscroll, xscrollcommand=h_scrollbar.set)
+        self.canvas.bind("<Configure>", lambda e: self._request_visible_render())
         
         # Grid layout for canvas and scrollbars
         self.canvas.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
         h_scrollbar.grid(row=1, column=0, sticky="ew")
         
         canvas_frame.grid_rowconfigure(0, weight=1)
@@ -335,38 +390,52 @@ class PDFViewerApp:
         self.canvas.bind("<Motion>", self.show_crosshair)
         self.canvas.bind("<Leave>", self.hide_crosshair)
         
-        # Enhanced mouse wheel scrolling for PDF canvas
-        def _on_canvas_mousewheel(event):
-            try:
-                # Handle different platforms
-                if event.delta:
-                    delta = int(-1 * (event.delta / 120))
-                elif event.num == 4:
-                    delta = -1
-                elif event.num == 5:
-                    delta = 1
-                else:
-                    return
-                
-                # Scroll vertically by default, horizontally with Shift
-                if event.state & 0x1:  # Shift key pressed
-                    self.canvas.xview_scroll(delta, "units")
-                else:
-                    self.canvas.yview_scroll(delta, "units")
-                return "break"
-            except Exception:
-                pass
-        
-        # Bind mouse wheel to PDF canvas
-        self.canvas.bind("<MouseWheel>", _on_canvas_mousewheel)  # Windows
-        self.canvas.bind("<Button-4>", _on_canvas_mousewheel)    # Linux scroll up  
-        self.canvas.bind("<Button-5>", _on_canvas_mousewheel)    # Linux scroll down
-        
         # Variables for crop selection
         self.crop_start = None
-        self.crop_rect = None
         self.cropping = False
         
+        # Single selection rectangle reused across drags (moved via coords, never recreated per motion)
+        self.crop_rect = self._create_crop_rect()
+        
+        # Crosshair guide lines, moved on mouse motion and redrawn at most once per idle cycle
+        self._vline, self._hline = self._create_crosshair_lines()
+        self._crosshair_pos = None  # Latest cursor position in canvas coordinates
+        self._crosshair_after = None  # Pending after_idle id of the crosshair redraw
+        
+    def _global_mousewheel(self, event):
+        """Route mouse wheel events to the left panel or the PDF canvas under the cursor"""
+        try:
+            # Handle different platforms (Windows uses event.delta, Linux uses event.num)
+            if event.delta:
+                delta = int(-1 * (event.delta / 120))
+            elif event.num == 4:
+                delta = -1
+            elif event.num == 5:
+                delta = 1
+            else:
+                return
+            
+            # Walk up from the widget under the cursor to find the scrollable area
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+            while widget is not None:
+                # These scroll themselves through their class bindings, which run before this
+                # all-binding, so scrolling the panel too would scroll twice
+                if isinstance(widget, (tk.Listbox, tk.Text, ttk.Treeview)):
+                    return
+                if widget is self.canvas:
+                    # Scroll vertically by default, horizontally with Shift
+                    if event.state & 0x1:  # Shift key pressed
+                        self.canvas.xview_scroll(delta, "units")
+                    else:
+                        self.canvas.yview_scroll(delta, "units")
+                    return "break"
+                if widget is self.left_scroll_frame:
+                    self.left_canvas.yview_scroll(delta, "units")
+                    return "break"
+                widget = widget.master
+        except Exception:
+            pass
+        
     def setup_status_bar(self):
         """Setup the status bar"""
         self.status_bar = ttk.Frame(self.root)
@@ -431,9 +500,15 @@ class PDFViewerApp:
     def _pdf_loaded_callback(self, pdf_doc, file_path):
         """Callback when PDF is successfully loaded"""
         self.pdf_document = pdf_doc
+        self.extractor = ImageExtractor(pdf_doc)
+        self._cached_metadata = dict(pdf_doc.metadata or {})
         self.current_file_path = file_path  # Store for default naming
         self.current_page = 0
-        self.pdf_images = []
+        self._page_cache.clear()
+        self._search_cache.clear()
+        self._set_disk_cache_dir(file_path)
+        self._apply_saved_naming_pattern(os.path.basename(file_path))
+        self.begin_batch()
         self.crop_selections = []  # Clear previous crops
         self.crop_history = []
         
@@ -453,6 +528,7 @@ class PDFViewerApp:
             self.render_continuous_pages()
         else:
             self.render_current_page()
+        self.end_batch()
         
         # Update navigation
         self.update_navigation()
@@ -469,16 +545,34 @@ class PDFViewerApp:
         messagebox.showerror("Error", f"Failed to load PDF: {error_msg}")
         
     def update_pdf_info(self, file_path):
-        """Update the PDF information display"""
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete(1.0, tk.END)
+        """Update the PDF information display (skipped if the same unchanged file is shown)"""
+        try:
+            file_stat = os.stat(file_path)
+            mtime = file_stat.st_mtime
+        except OSError:
+            file_stat = mtime = None
+            
+        if mtime is not None and file_path == self._info_last_path and mtime == self._info_last_mtime:
+            return
+        self._info_last_path = file_path
+        self._info_last_mtime = mtime
         
+        # Fill the panel once the page render has been handled
+        self.root.after_idle(self._fill_pdf_info, self.pdf_document, file_path, file_stat)
+        
+    def _fill_pdf_info(self, pdf_document, file_path, file_stat=None):
+        """Write the PDF information into the info panel"""
         try:
-            info = get_pdf_info(self.pdf_document, file_path)
-            self.info_text.insert(tk.END, info)
+            info = get_pdf_info(pdf_document, file_path, file_stat)
         except Exception as e:
-            self.info_text.insert(tk.END, f"Error reading PDF info: {str(e)}")
+            info = f"Error reading PDF info: {str(e)}"
             
+        self._set_info_text(info)
+        
+    def _set_info_text(self, info):
+        """Replace the info panel text in a single edit"""
+        self.info_text.config(state=tk.NORMAL)
+        self.info_text.replace("1.0", tk.END, info)
         self.info_text.config(state=tk.DISABLED)
         
     def render_current_page(self):
@@ -487,36 +581,29 @@ class PDFViewerApp:
             return
             
         try:
-            page = self.pdf_document[self.current_page]
-            
-            # Calculate render matrix for high DPI
-            matrix = fitz.Matrix(self.zoom_level * 2, self.zoom_level * 2)  # 2x for high DPI
-            
-            # Render page to pixmap
-            pix = page.get_pixmap(matrix=matrix, alpha=False)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("ppm")
-            pil_image = Image.open(io.BytesIO(img_data))
-            
-            # Resize for display (while keeping original for extraction)
-            display_width = int(pil_image.width * self.zoom_level)
-            display_height = int(pil_image.height * self.zoom_level)
-            display_image = pil_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            self.current_image = ImageTk.PhotoImage(display_image)
-            
-            # Store original high-res image for extraction
+            # Display image and original high-res image for extraction (cached per page)
+            pil_image = self._get_page_image(self.current_page)
             self.original_image = pil_image
-            self.page_dpi = 72 * 2  # Base DPI * matrix scale
             
-            # Clear canvas and display image
-            self.canvas.delete("all")
-            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.current_image, tags="page")
+            # Reuse the page PhotoImage when the page size is unchanged
+            if self.current_image is not None and (self.current_image.width(), self.current_image.height()) == pil_image.size:
+                self.current_image.paste(pil_image)
+            else:
+                self.current_image = ImageTk.PhotoImage(pil_image)
+            self.page_dpi = 72 * self.get_display_scale()  # Base DPI * matrix scale
+            
+            # Reuse the persistent page item; other canvas items (crops, selection) are kept
+            if self._page_item is not None and self.canvas.type(self._page_item):
+                self.canvas.itemconfig(self._page_item, image=self.current_image)
+                self.canvas.coords(self._page_item, 0, 0)
+            else:
+                # First render, or the canvas was cleared by the welcome/continuous view
+                self.canvas.delete("all")
+                self._page_item = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.current_image, tags="page")
+                self.canvas.tag_lower(self._page_item)
             
             # Update scroll region
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self.canvas.configure(scrollregion=(0, 0, pil_image.width, pil_image.height))
             
             # Reset scroll position to top-left when changing pages
             self.canvas.xview_moveto(0)
@@ -529,6 +616,10 @@ class PDFViewerApp:
             if hasattr(self, 'viz_highlight_var') and self.viz_highlight_var.get():
                 self.highlight_visualization_keywords()
             
+            # Once the page is on screen, render its neighbours while idle so page flips hit the cache
+            if not self._prefetch_after:
+                self._prefetch_after = self.root.after_idle(self._prefetch_neighbour_pages)
+            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to render page: {str(e)}")
     
@@ -538,62 +629,9 @@ class PDFViewerApp:
             return
             
         try:
-            # Clear canvas
-            self.canvas.delete("all")
-            
-            # Reset position tracking
-            self.page_positions = []
-            self.page_heights = []
-            current_y = 0
-            
-            # Store page images to prevent garbage collection
-            self.page_images = []
-            
-            # Render each page
-            for page_num in range(len(self.pdf_document)):
-                page = self.pdf_document[page_num]
-                
-                # Calculate render matrix
-                matrix = fitz.Matrix(self.zoom_level * 2, self.zoom_level * 2)
-                
-                # Render page to pixmap
-                pix = page.get_pixmap(matrix=matrix, alpha=False)
-                
-                # Convert to PIL Image
-                img_data = pix.tobytes("ppm")
-                pil_image = Image.open(io.BytesIO(img_data))
-                
-                # Resize for display
-                display_width = int(pil_image.width * self.zoom_level)
-                display_height = int(pil_image.height * self.zoom_level)
-                display_image = pil_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-                
-                # Convert to PhotoImage and store
-                page_photo = ImageTk.PhotoImage(display_image)
-                self.page_images.append(page_photo)
-                
-                # Store page position
-                self.page_positions.append(current_y)
-                self.page_heights.append(display_height)
-                
-                # Create image on canvas
-                self.canvas.create_image(0, current_y, anchor=tk.NW, image=page_photo, 
-                                       tags=f"page_{page_num}")
-                
-                # Add page number label
-                self.canvas.create_text(10, current_y + 10, text=f"Page {page_num + 1}", 
-                                      anchor=tk.NW, fill="red", font=("Arial", 12, "bold"),
-                                      tags=f"page_label_{page_num}")
-                
-                # Move to next page position
-                current_y += display_height + self.page_gap
-            
-            # Store total height
-            self.total_height = current_y
-            
-            # Update scroll region
-            max_width = max(img.width() for img in self.page_images) if self.page_images else 800
-            self.canvas.configure(scrollregion=(0, 0, max_width, self.total_height))
+            # Lay out every page, then rasterize only the pages in view
+            self.layout_continuous_pages()
+            self._render_visible_pages()
             
             # Redraw crop rectangles
             self.redraw_crop_rectangles()
@@ -603,11 +641,321 @@ class PDFViewerApp:
                 self.highlight_visualization_keywords()
             
             # Store current page DPI for extraction
-            self.page_dpi = 72 * 2
+            self.page_dpi = 72 * self.get_display_scale()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to render continuous pages: {str(e)}")
     
+    def layout_continuous_pages(self):
+        """Compute page positions for continuous mode and draw page placeholders"""
+        # Clear canvas
+        self.canvas.delete("all")
+        
+        # Reset position tracking
+        self.page_positions = []
+        self.page_heights = []
+        current_y = 0
+        max_width = 0
+        
+        # Page images currently on the canvas, keyed by page number
+        self.page_images = {}
+        
+        # Page sizes come from the PDF page rectangles, no rasterization needed.
+        # Rounding matches the pixmap size produced by _rasterize_page.
+        display_scale = self.get_display_scale()
+        matrix = fitz.Matrix(display_scale, display_scale)
+        for page_num in range(len(self.pdf_document)):
+            page_irect = (self.pdf_document[page_num].rect * matrix).irect
+            display_width = page_irect.width
+            display_height = page_irect.height
+            
+            # Store page position
+            self.page_positions.append(current_y)
+            self.page_heights.append(display_height)
+            max_width = max(max_width, display_width)
+            
+            # Placeholder shown until the page is rasterized
+            self.canvas.create_rectangle(0, current_y, display_width, current_y + display_height,
+                                       outline="lightgray", fill="#f0f0f0",
+                                       tags=("page_placeholder", f"page_placeholder_{page_num}"))
+            
+            # Add page number label
+            self.canvas.create_text(10, current_y + 10, text=f"Page {page_num + 1}", 
+                                  anchor=tk.NW, fill="red", font=("Arial", 12, "bold"),
+                                  tags=f"page_label_{page_num}")
+            
+            # Move to next page position
+            current_y += display_height + self.page_gap
+        
+        # Store total height
+        self.total_height = current_y
+        
+        # Update scroll region
+        self.canvas.configure(scrollregion=(0, 0, max_width or 800, self.total_height))
+        
+    def _visible_page_range(self):
+        """Get the range of pages intersecting the visible canvas area in continuous mode"""
+        if not self.page_positions:
+            return range(0)
+        
+        # Map the visible fraction of the scroll region to canvas pixels
+        top_fraction, bottom_fraction = self.canvas.yview()
+        view_top = top_fraction * self.total_height
+        view_bottom = bottom_fraction * self.total_height
+        
+        first = max(bisect.bisect_right(self.page_positions, view_top) - 1, 0)
+        last = max(bisect.bisect_right(self.page_positions, view_bottom) - 1, 0)
+        return range(first, last + 1)
+        
+    def _render_visible_pages(self):
+        """Rasterize pages in view (plus one page margin) and release pages far from view"""
+        if not self.continuous_mode or not self.pdf_document or not self.page_positions:
+            return
+        
+        window = self._page_window()
+        
+        # Release pages that scrolled out of the window
+        for page_num in list(self.page_images):
+            if page_num not in window:
+                self.canvas.delete(f"page_{page_num}")
+                del self.page_images[page_num]
+        
+        for page_num in window:
+            if page_num in self.page_images:
+                continue
+            
+            # Get display image from the page cache and keep a reference to prevent garbage collection
+            page_photo = ImageTk.PhotoImage(self._get_page_image(page_num))
+            self.page_images[page_num] = page_photo
+            
+            # Place the image directly above its placeholder, below labels and overlays
+            image_item = self.canvas.create_image(0, self.page_positions[page_num], anchor=tk.NW,
+                                                  image=page_photo, tags=f"page_{page_num}")
+            self.canvas.tag_raise(image_item, f"page_placeholder_{page_num}")
+            
+    def _page_window(self):
+        """Get the visible page range widened by one page on each side"""
+        visible = self._visible_page_range()
+        return range(max(visible.start - 1, 0), min(visible.stop + 1, len(self.page_positions)))
+            
+    def _on_canvas_yscroll(self, first, last):
+        """Update the vertical scrollbar and schedule rendering of newly visible pages"""
+        self.v_scrollbar.set(first, last)
+        self._request_visible_render()
+    
+    def _request_visible_render(self):
+        """Coalesce viewport renders so a burst of scroll events renders once per idle cycle"""
+        if self._visible_after:
+            return
+        self._visible_after = self.root.after_idle(self._do_visible_render)
+    
+    def _do_visible_render(self):
+        """Render the pages in view and refresh their highlights"""
+        self._visible_after = None
+        self._render_visible_pages()
+        
+        # Draw saved crops for pages that scrolled into the window
+        if self.continuous_mode and self.crop_selections and self._page_window() != self._crop_pages_drawn:
+            self.redraw_crop_rectangles()
+        
+        # Stream in highlights for pages that scrolled into view
+        if (self.continuous_mode and self.show_viz_highlights and self.pdf_document
+                and self._visible_page_range() != self._viz_scanned_pages):
+            self.highlight_visualization_keywords()
+    
+    def _get_page_image(self, page_num):
+        """
+        Get the rendered display image for a page, using the LRU page cache
+        
+        Args:
+            page_num: Page number (0-based)
+            
+        Returns:
+            PIL.Image: Rendered page at display scale
+        """
+        key = (page_num, round(self.zoom_level, 3))
+        pil_image = self._page_cache.get(key)
+        if pil_image is not None:
+            self._page_cache.move_to_end(key)
+        else:
+            pil_image = self._rasterize_page(self.pdf_document, page_num, self.zoom_level, self._disk_cache_dir)
+            self._cache_page(key, pil_image)
+        return pil_image
+    
+    def _cache_page(self, key, pil_image):
+        """Store a rendered page image in the cache, evicting the least recently used page when full"""
+        self._page_cache[key] = pil_image
+        if len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last=False)
+    
+    def get_display_scale(self, zoom_level=None):
+        """Get the scale from PDF points to display pixels (2x for high DPI)"""
+        if zoom_level is None:
+            zoom_level = self.zoom_level
+        return zoom_level * 2
+    
+    def _rasterize_page(self, pdf_doc, page_num, zoom_level, cache_dir=None):
+        """
+        Render a page at display size to a PIL image
+        
+        Args:
+            pdf_doc: Document to render from
+            page_num: Page number (0-based)
+            zoom_level: Zoom level to render at
+            cache_dir: Disk cache directory of the document, or None to skip the disk cache
+            
+        Returns:
+            PIL.Image: Rendered page
+        """
+        # Reuse a page rendered in an earlier session
+        cache_path = None
+        if cache_dir:
+            cache_path = os.path.join(cache_dir, f"p{page_num}_z{round(zoom_level, 3)}.png")
+            try:
+                with Image.open(cache_path) as cached_image:
+                    pil_image = cached_image.convert("RGB")
+                os.utime(cache_path)  # Mark as recently used for eviction
+                return pil_image
+            except OSError:
+                pass
+        
+        # Render directly at the display scale so no resize pass is needed
+        display_scale = self.get_display_scale(zoom_level)
+        matrix = fitz.Matrix(display_scale, display_scale)
+        
+        with self._render_lock:
+            render_start = time.perf_counter()
+            pix = pdf_doc[page_num].get_pixmap(matrix=matrix, alpha=False)
+            samples = pix.samples
+            size = (pix.width, pix.height)
+            render_time = time.perf_counter() - render_start
+        
+        # Wrap the raw RGB samples directly (no PPM encode/decode round-trip)
+        pil_image = Image.frombuffer("RGB", size, samples, "raw", "RGB", 0, 1)
+        
+        # Only slow pages are worth a disk copy; encode it off the UI thread
+        if cache_path and render_time >= DISK_CACHE_MIN_RENDER_SECONDS:
+            self._cache_pool.submit(self._write_cached_page, pil_image, cache_path)
+                
+        return pil_image
+    
+    def _write_cached_page(self, pil_image, cache_path):
+        """Write a rendered page to the disk cache (runs on the cache thread)"""
+        # Fast compression; write to a temporary name so readers never see a partial file
+        temp_cache_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            pil_image.save(temp_cache_path, "PNG", compress_level=1)
+            os.replace(temp_cache_path, cache_path)
+        except OSError as e:
+            log_error(f"Could not write page cache file: {e}", "Render")
+    
+    def _set_disk_cache_dir(self, file_path):
+        """Select the disk cache directory for the current document once the cache thread has hashed it"""
+        self._disk_cache_dir = None
+        pdf_doc = self.pdf_document
+        future = self._cache_pool.submit(self._make_disk_cache_dir, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._disk_cache_dir_callback, pdf_doc, f)
+        )
+        
+        # Keep the cache within its size limit
+        self._cache_pool.submit(self._trim_disk_cache)
+    
+    def _make_disk_cache_dir(self, file_path):
+        """
+        Create the disk cache directory of a document, keyed by a hash of its content (runs on the cache thread)
+        
+        Args:
+            file_path: Path of the document
+            
+        Returns:
+            str: Cache directory of the document
+        """
+        # Other users must not be able to read cached pages or plant their own
+        os.makedirs(DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+        if hasattr(os, 'getuid'):
+            root_stat = os.lstat(DISK_CACHE_DIR)
+            if (not stat.S_ISDIR(root_stat.st_mode) or root_stat.st_uid != os.getuid()
+                    or root_stat.st_mode & 0o077):
+                raise OSError(f"{DISK_CACHE_DIR} is not a private directory owned by this user")
+        
+        # The first 1 MB plus size and modification time identify a document revision;
+        # incremental saves keep the start of the file, so the mtime tells them apart
+        file_stat = os.stat(file_path)
+        digest = hashlib.sha1(f"{file_stat.st_size}:{file_stat.st_mtime_ns}".encode())
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(1024 * 1024))
+        cache_dir = os.path.join(DISK_CACHE_DIR, digest.hexdigest()[:16])
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        return cache_dir
+    
+    def _disk_cache_dir_callback(self, pdf_doc, future):
+        """Callback when the disk cache directory of a document is ready"""
+        try:
+            cache_dir = future.result()
+        except OSError as e:
+            log_error(f"Page disk cache disabled: {e}", "Render")
+            return
+        
+        # Ignore a directory for a document that has since been replaced
+        if pdf_doc is self.pdf_document:
+            self._disk_cache_dir = cache_dir
+    
+    def _trim_disk_cache(self):
+        """Delete the least recently used cached pages while the cache exceeds its size limit"""
+        entries = []
+        total_size = 0
+        for dirpath, _, filenames in os.walk(DISK_CACHE_DIR):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    file_stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((file_stat.st_mtime, file_stat.st_size, path))
+                total_size += file_stat.st_size
+        
+        # Oldest first
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= DISK_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+    
+    def _prefetch_neighbour_pages(self):
+        """
+        Render the nearest uncached neighbour of the current page into the page cache
+        
+        PyMuPDF holds the GIL while rendering, so a worker thread would stall the UI just the
+        same. Pages are instead rendered on the main thread one per idle callback, letting
+        input events run between renders.
+        """
+        self._prefetch_after = None
+        if not self.pdf_document or self.continuous_mode:
+            return
+        
+        zoom_level = self.zoom_level
+        for offset in (1, -1, 2, -2):
+            page_num = self.current_page + offset
+            key = (page_num, round(zoom_level, 3))
+            if not 0 <= page_num < len(self.pdf_document) or key in self._page_cache:
+                continue
+            
+            try:
+                pil_image = self._rasterize_page(self.pdf_document, page_num, zoom_level, self._disk_cache_dir)
+            except Exception as e:
+                log_error(f"Page prefetch failed: {e}", "Render")
+                return
+            self._cache_page(key, pil_image)
+            
+            # Continue with the next neighbour once pending events have been handled
+            self._prefetch_after = self.root.after_idle(self._prefetch_neighbour_pages)
+            return
+    
     def toggle_view_mode(self):
         """Toggle between continuous and single page view"""
         self.continuous_mode = self.continuous_var.get()
@@ -618,14 +966,11 @@ class PDFViewerApp:
         # Clear any existing search highlights
         self.canvas.delete("search_highlight")
         
-        # Re-render in new mode
+        # Re-render in new mode (both renderers reapply highlights themselves)
         if self.continuous_mode:
             self.render_continuous_pages()
         else:
             self.render_current_page()
-        
-        # Reapply highlights
-        self.highlight_visualization_keywords()
     
 
     
@@ -638,6 +983,7 @@ class PDFViewerApp:
         else:
             self.canvas.delete("viz_highlight")
             self.viz_highlights = []
+            self._viz_overlays = []
 
     def highlight_visualization_keywords(self):
         """Auto-highlight visualization keywords"""
@@ -647,24 +993,32 @@ class PDFViewerApp:
         # Clear previous viz highlights
         self.canvas.delete("viz_highlight")
         self.viz_highlights = []
+        self._viz_overlays = []
         
-        # Search for each visualization keyword
-        for keyword in self.viz_keywords:
-            for page_num in range(len(self.pdf_document)):
-                page = self.pdf_document[page_num]
-                
+        # search_for is case-insensitive, so 'fig' and 'Fig' only need one search
+        keywords = list(dict.fromkeys(keyword.lower() for keyword in self.viz_keywords))
+        
+        # Only pages on screen need highlights
+        if self.continuous_mode:
+            pages_to_scan = self._visible_page_range()
+        else:
+            pages_to_scan = range(self.current_page, self.current_page + 1)
+        self._viz_scanned_pages = pages_to_scan
+        
+        for page_num in pages_to_scan:
+            page_boxes = []
+            
+            # Search for each visualization keyword
+            for keyword in keywords:
                 # Search for keyword instances
-                text_instances = page.search_for(keyword)
+                text_instances = self._search_page(page_num, keyword)
                 
                 for inst in text_instances:
                     # Convert PDF coordinates to display coordinates
                     if self.continuous_mode:
                         display_coords = self.pdf_to_continuous_coords(inst, page_num)
                     else:
-                        if page_num == self.current_page:
-                            display_coords = self.pdf_to_display_coords(inst)
-                        else:
-                            continue
+                        display_coords = self.pdf_to_display_coords(inst)
                     
                     if display_coords:
                         self.viz_highlights.append({
@@ -672,22 +1026,49 @@ class PDFViewerApp:
                             'page': page_num,
                             'keyword': keyword
                         })
-                        
-                        # Create highlight rectangle
-                        self.canvas.create_rectangle(
-                            display_coords[0], display_coords[1], 
-                            display_coords[2], display_coords[3],
-                            outline="blue", fill="lightblue", width=1, stipple="gray25",
-                            tags="viz_highlight"
-                        )
+                        page_boxes.append(display_coords)
+            
+            # Draw all highlights of the page as a single canvas item
+            if page_boxes:
+                self._draw_highlight_overlay(page_boxes)
+    
+    def _draw_highlight_overlay(self, boxes):
+        """Draw highlight rectangles into one translucent image covering their bounding box"""
+        left = int(min(box[0] for box in boxes))
+        top = int(min(box[1] for box in boxes))
+        right = int(max(box[2] for box in boxes)) + 2
+        bottom = int(max(box[3] for box in boxes)) + 2
+        
+        overlay = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        for box in boxes:
+            draw.rectangle(
+                (box[0] - left, box[1] - top, box[2] - left, box[3] - top),
+                fill=(173, 216, 230, 64), outline=(0, 0, 255, 255)
+            )
+        
+        # Keep a reference to prevent garbage collection
+        overlay_photo = ImageTk.PhotoImage(overlay)
+        self._viz_overlays.append(overlay_photo)
+        self.canvas.create_image(left, top, anchor=tk.NW, image=overlay_photo, tags="viz_highlight")
+    
+    def _search_page(self, page_num, keyword):
+        """Get the text instances of a keyword on a page, cached per document"""
+        key = (page_num, keyword)
+        text_instances = self._search_cache.get(key)
+        if text_instances is None:
+            with self._render_lock:
+                text_instances = self.pdf_document[page_num].search_for(keyword)
+            self._search_cache[key] = text_instances
+        return text_instances
     
     def pdf_to_display_coords(self, pdf_rect):
         """Convert PDF coordinates to display coordinates (single page mode)"""
-        if not hasattr(self, 'current_image') and not hasattr(self, 'page_images'):
+        if self.current_image is None and not self.page_images:
             return None
         
         # Scale factor from PDF to display  
-        scale_factor = self.zoom_level * 2
+        scale_factor = self.get_display_scale()
         
         return (
             pdf_rect[0] * scale_factor,  # left
@@ -702,7 +1083,7 @@ class PDFViewerApp:
             return None
         
         # Scale factor from PDF to display  
-        scale_factor = self.zoom_level * 2
+        scale_factor = self.get_display_scale()
         
         # Get page position offset
         page_y_offset = self.page_positions[page_num]
@@ -719,36 +1100,22 @@ class PDFViewerApp:
         if not hasattr(self, 'page_positions') or not self.page_positions:
             return 0  # Default to first page if no positions available
         
-        # Find the page that contains this Y coordinate
-        for page_num in range(len(self.page_positions)):
-            page_start_y = self.page_positions[page_num]
-            
-            # Get page end Y coordinate
-            if page_num < len(self.page_heights):
-                page_height = self.page_heights[page_num]
-                page_end_y = page_start_y + page_height
-            else:
-                page_end_y = page_start_y + 500  # Default height if not available
-            
-            # Check if Y coordinate falls within this page
-            if page_start_y <= y_coord <= page_end_y:
-                return page_num
-        
-        # If not found, return the last page
-        return len(self.page_positions) - 1 if self.page_positions else 0
+        # Page positions are sorted ascending, so the owning page is the last one starting at or before y
+        page_num = bisect.bisect_right(self.page_positions, y_coord) - 1
+        return min(max(page_num, 0), len(self.page_positions) - 1)
     
 
             
     def update_navigation(self):
         """Update navigation controls"""
         if not self.pdf_document:
-            self.page_status_label.config(text="No PDF loaded")
-            self.total_pages_label.config(text="of 0")
-            self.first_btn.config(state=tk.DISABLED)
-            self.prev_btn.config(state=tk.DISABLED)
-            self.next_btn.config(state=tk.DISABLED)
-            self.last_btn.config(state=tk.DISABLED)
-            self.page_entry.config(state=tk.DISABLED)
+            self._config_nav_widget('label', self.page_status_label, text="No PDF loaded")
+            self._config_nav_widget('total', self.total_pages_label, text="of 0")
+            self._config_nav_widget('first', self.first_btn, state=tk.DISABLED)
+            self._config_nav_widget('prev', self.prev_btn, state=tk.DISABLED)
+            self._config_nav_widget('next', self.next_btn, state=tk.DISABLED)
+            self._config_nav_widget('last', self.last_btn, state=tk.DISABLED)
+            self._config_nav_widget('entry', self.page_entry, state=tk.DISABLED)
             self.page_var.set("")
             return
             
@@ -756,22 +1123,29 @@ class PDFViewerApp:
         current_display = self.current_page + 1
         
         # Update page display
-        self.page_status_label.config(text=f"Page {current_display} of {total_pages}")
-        self.total_pages_label.config(text=f"of {total_pages}")
+        self._config_nav_widget('label', self.page_status_label, text=f"Page {current_display} of {total_pages}")
+        self._config_nav_widget('total', self.total_pages_label, text=f"of {total_pages}")
         
         # Update page entry if not currently being edited
         if self.page_entry != self.root.focus_get():
             self.page_var.set(str(current_display))
         
         # Enable/disable navigation buttons
-        self.page_entry.config(state=tk.NORMAL)
-        self.first_btn.config(state=tk.NORMAL if self.current_page > 0 else tk.DISABLED)
-        self.prev_btn.config(state=tk.NORMAL if self.current_page > 0 else tk.DISABLED)
-        self.next_btn.config(state=tk.NORMAL if self.current_page < total_pages - 1 else tk.DISABLED)
-        self.last_btn.config(state=tk.NORMAL if self.current_page < total_pages - 1 else tk.DISABLED)
+        self._config_nav_widget('entry', self.page_entry, state=tk.NORMAL)
+        self._config_nav_widget('first', self.first_btn, state=tk.NORMAL if self.current_page > 0 else tk.DISABLED)
+        self._config_nav_widget('prev', self.prev_btn, state=tk.NORMAL if self.current_page > 0 else tk.DISABLED)
+        self._config_nav_widget('next', self.next_btn, state=tk.NORMAL if self.current_page < total_pages - 1 else tk.DISABLED)
+        self._config_nav_widget('last', self.last_btn, state=tk.NORMAL if self.current_page < total_pages - 1 else tk.DISABLED)
         
         # Zoom label removed with zoom functionality
         
+    def _config_nav_widget(self, key, widget, **options):
+        """Configure a navigation widget only when its options differ from the last applied ones"""
+        if self._nav_state.get(key) == options:
+            return
+        widget.config(**options)
+        self._nav_state[key] = options
+        
     def previous_page(self):
         """Go to previous page"""
         if self.pdf_document and self.current_page > 0:
@@ -816,6 +1190,9 @@ class PDFViewerApp:
         total_pages = len(self.pdf_document)
         
         if 0 <= page_index < total_pages:
+            # Already showing this page, nothing to re-render
+            if page_index == self.current_page:
+                return True
             self.current_page = page_index
             if not self.continuous_mode:
                 self.render_current_page()
@@ -850,7 +1227,14 @@ class PDFViewerApp:
                 self.page_var.set("")
                 
     def on_page_input_change(self, *args):
-        """Handle real-time validation of page input"""
+        """Handle real-time validation of page input (debounced while typing)"""
+        if self._pending_page_after:
+            self.root.after_cancel(self._pending_page_after)
+        self._pending_page_after = self.root.after(50, self._apply_page_input_change)
+        
+    def _apply_page_input_change(self):
+        """Validate the page input and color it accordingly"""
+        self._pending_page_after = None
         if not self.pdf_document:
             return
             
@@ -864,13 +1248,19 @@ class PDFViewerApp:
             
             # Visual feedback for valid/invalid page numbers
             if 1 <= page_number <= total_pages:
-                self.page_entry.config(foreground="black")
+                self._set_page_entry_fg("black")
             else:
-                self.page_entry.config(foreground="red")
+                self._set_page_entry_fg("red")
                 
         except ValueError:
             # Invalid input - show red text
-            self.page_entry.config(foreground="red")
+            self._set_page_entry_fg("red")
+            
+    def _set_page_entry_fg(self, color):
+        """Set the page entry text color, skipping the widget call if it is already applied"""
+        if color != self._page_entry_fg:
+            self.page_entry.config(foreground=color)
+            self._page_entry_fg = color
             
     def on_page_entry_focus_out(self, event=None):
         """Handle when page entry loses focus"""
@@ -892,7 +1282,7 @@ class PDFViewerApp:
                 self.page_var.set(str(self.current_page + 1))
                 
         # Reset text color
-        self.page_entry.config(foreground="black")
+        self._set_page_entry_fg("black")
         
     def focus_page_entry(self):
         """Focus on page entry for direct navigation"""
@@ -907,17 +1297,19 @@ class PDFViewerApp:
         """Show crosshair guides at cursor position"""
         if not self.pdf_document:
             return
-            
-        # Delete existing crosshair
-        self.canvas.delete("crosshair")
         
-        # Get canvas coordinates
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
+        # Remember the latest position; a burst of motion events draws once when idle
+        self._crosshair_pos = (self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if self._crosshair_after:
+            return
+        self._crosshair_after = self.root.after_idle(self._draw_crosshair)
         
-        # Get canvas dimensions
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+    def _draw_crosshair(self):
+        """Move the crosshair lines to the latest cursor position"""
+        self._crosshair_after = None
+        if self._crosshair_pos is None:
+            return
+        canvas_x, canvas_y = self._crosshair_pos
         
         # Get scroll region to determine actual content size
         scroll_region = self.canvas.cget('scrollregion')
@@ -926,20 +1318,31 @@ class PDFViewerApp:
             max_x = scroll_bounds[2]
             max_y = scroll_bounds[3]
         else:
-            max_x = canvas_width
-            max_y = canvas_height
-        
-        # Draw vertical line
-        self.canvas.create_line(canvas_x, 0, canvas_x, max_y, 
-                               fill="#808080", dash=(5, 5), width=1, tags="crosshair")
+            max_x = self.canvas.winfo_width()
+            max_y = self.canvas.winfo_height()
+        
+        # Recreate the lines if a page render cleared the canvas
+        if not self.canvas.type(self._vline) or not self.canvas.type(self._hline):
+            self.canvas.delete("crosshair")
+            self._vline, self._hline = self._create_crosshair_lines()
+        
+        self.canvas.coords(self._vline, canvas_x, 0, canvas_x, max_y)
+        self.canvas.coords(self._hline, 0, canvas_y, max_x, canvas_y)
+        self.canvas.itemconfigure("crosshair", state=tk.NORMAL)
+        self.canvas.tag_raise("crosshair")
+        
+    def _create_crosshair_lines(self):
+        """Create the hidden vertical and horizontal crosshair guide lines"""
+        return tuple(
+            self.canvas.create_line(0, 0, 0, 0, fill="#808080", dash=(5, 5), width=1,
+                                    state=tk.HIDDEN, tags="crosshair")
+            for _ in range(2)
+        )
         
-        # Draw horizontal line
-        self.canvas.create_line(0, canvas_y, max_x, canvas_y, 
-                               fill="#808080", dash=(5, 5), width=1, tags="crosshair")
-                               
-    def hide_crosshair(self, event):
+    def hide_crosshair(self, event=None):
         """Hide crosshair guides when cursor leaves canvas"""
-        self.canvas.delete("crosshair")
+        self._crosshair_pos = None
+        self.canvas.itemconfigure("crosshair", state=tk.HIDDEN)
         
     def start_crop(self, event):
         """Start crop selection"""
@@ -947,7 +1350,7 @@ class PDFViewerApp:
             return
             
         # Hide crosshair during cropping
-        self.canvas.delete("crosshair")
+        self.hide_crosshair()
         
         # Convert canvas coordinates to image coordinates
         canvas_x = self.canvas.canvasx(event.x)
@@ -956,8 +1359,20 @@ class PDFViewerApp:
         self.crop_start = (canvas_x, canvas_y)
         self.cropping = True
         
-        # Delete any existing crop rectangle
-        self.canvas.delete("crop_rect")
+        # Recreate the selection rectangle if a page render cleared the canvas
+        if not self.canvas.type(self.crop_rect):
+            self.crop_rect = self._create_crop_rect()
+        
+        # Show the selection rectangle at the start point, above the page image
+        self.canvas.coords(self.crop_rect, canvas_x, canvas_y, canvas_x, canvas_y)
+        self.canvas.itemconfigure(self.crop_rect, state=tk.NORMAL)
+        self.canvas.tag_raise(self.crop_rect)
+        
+    def _create_crop_rect(self):
+        """Create the hidden rectangle used to show the active crop selection"""
+        return self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="red", width=2, state=tk.HIDDEN, tags="crop_rect"
+        )
         
     def update_crop(self, event):
         """Update crop selection rectangle"""
@@ -967,14 +1382,8 @@ class PDFViewerApp:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
         
-        # Delete previous rectangle
-        self.canvas.delete("crop_rect")
-        
-        # Draw new rectangle
-        self.crop_rect = self.canvas.create_rectangle(
-            self.crop_start[0], self.crop_start[1], canvas_x, canvas_y,
-            outline="red", width=2, tags="crop_rect"
-        )
+        # Move the existing selection rectangle
+        self.canvas.coords(self.crop_rect, self.crop_start[0], self.crop_start[1], canvas_x, canvas_y)
         
     def finish_crop(self, event):
         """Finish crop selection"""
@@ -984,6 +1393,9 @@ class PDFViewerApp:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
         
+        # Hide the selection rectangle until the next drag
+        self.canvas.itemconfigure(self.crop_rect, state=tk.HIDDEN)
+        
         # Re-enable crosshair after cropping
         self.show_crosshair(event)
         
@@ -1000,37 +1412,30 @@ class PDFViewerApp:
             bottom = max(y1, y2)
             
             # Convert display coordinates to PDF coordinates for storage
-            display_scale = max(self.zoom_level * 2.0, 0.1)  # Ensure positive scale, minimum 0.1
+            display_scale = max(self.get_display_scale(), 0.1)  # Ensure positive scale, minimum 0.1
+            inv_scale = 1.0 / display_scale
             
-            # Convert to PDF coordinates (normalized, zoom-independent)
+            # Find the page this crop belongs to and its offset on the canvas
+            crop_page = self.current_page
+            page_y_offset = 0
             if self.continuous_mode:
-                # Find which page this crop belongs to
-                crop_page = self.find_page_from_y_coord(top)
-                if crop_page is not None and crop_page < len(self.page_positions):
-                    page_y_offset = self.page_positions[crop_page]
-                    pdf_left = left / display_scale
-                    pdf_top = (top - page_y_offset) / display_scale
-                    pdf_right = right / display_scale
-                    pdf_bottom = (bottom - page_y_offset) / display_scale
-                else:
-                    crop_page = self.current_page
-                    pdf_left = left / display_scale
-                    pdf_top = top / display_scale
-                    pdf_right = right / display_scale
-                    pdf_bottom = bottom / display_scale
-            else:
-                crop_page = self.current_page
-                pdf_left = left / display_scale
-                pdf_top = top / display_scale
-                pdf_right = right / display_scale
-                pdf_bottom = bottom / display_scale
+                found_page = self.find_page_from_y_coord(top)
+                if found_page is not None and found_page < len(self.page_positions):
+                    crop_page = found_page
+                    page_y_offset = self.page_positions[found_page]
+            
+            # Convert to PDF coordinates (normalized, zoom-independent)
+            pdf_left = left * inv_scale
+            pdf_top = (top - page_y_offset) * inv_scale
+            pdf_right = right * inv_scale
+            pdf_bottom = (bottom - page_y_offset) * inv_scale
             
             # Generate adaptive default name based on learned patterns
             default_name = self.get_adaptive_crop_name()
             
             # Store crops with PDF coordinates and display coordinates for drawing
             crop_data = {
-                'page': crop_page if self.continuous_mode else self.current_page,
+                'page': crop_page,
                 'coords': (left, top, right, bottom),  # Display coords for drawing rectangles
                 'pdf_coords': (pdf_left, pdf_top, pdf_right, pdf_bottom),  # PDF coords for extraction
                 'zoom': self.zoom_level,  # Zoom level when created (for display only)
@@ -1055,15 +1460,43 @@ class PDFViewerApp:
         self.cropping = False
         self.crop_start = None
         
+    def begin_batch(self):
+        """Start a bulk crop update; crop redraws are deferred until end_batch"""
+        self._suppress_redraw = True
+        self._redraw_dirty = False
+        
+    def end_batch(self):
+        """Finish a bulk crop update and redraw once if anything requested it"""
+        self._suppress_redraw = False
+        if self._redraw_dirty:
+            self._redraw_dirty = False
+            self.redraw_crop_rectangles()
+        
     def redraw_crop_rectangles(self):
         """Redraw all crop rectangles for current page"""
-        self.canvas.delete("saved_crop")
+        if self._suppress_redraw:
+            self._redraw_dirty = True
+            return
+        
+        current_scale = self.get_display_scale()
+        
+        # Drop the item pool if a page render cleared the canvas
+        if self._crop_items and not self.canvas.type(self._crop_items[0][0]):
+            self._crop_items = []
+        used_items = 0
+        self._crop_item_of = {}
+        
+        # Continuous mode only draws crops on pages in or next to the viewport
+        crop_pages = self._page_window() if self.continuous_mode else None
+        self._crop_pages_drawn = crop_pages
         
         for i, crop in enumerate(self.crop_selections):
+            if crop_pages is not None and crop['page'] not in crop_pages:
+                continue
+            
             # Convert PDF coordinates back to current display coordinates for drawing
             if 'pdf_coords' in crop:
                 pdf_coords = crop['pdf_coords']
-                current_scale = self.zoom_level * 2.0
                 crop_page = crop['page']
                 
                 # Calculate display coordinates based on view mode
@@ -1104,20 +1537,37 @@ class PDFViewerApp:
             bottom = max(top + height, top)
             
             if width > 5 and height > 5:  # Valid minimum size
-                rect = self.canvas.create_rectangle(
-                    left, top, right, bottom,
-                    outline="red", width=3, tags="saved_crop", fill=""
-                )
-                
-                # Add crop number label
+                # Crop number label position
                 center_x = (left + right) / 2
                 center_y = top + 15
-                self.canvas.create_text(
-                    center_x, center_y, text=f"#{i+1}",
-                    fill="red", font=("Arial", 12, "bold"), tags="saved_crop"
-                )
+                
+                if used_items < len(self._crop_items):
+                    # Move a pooled rectangle and label into place
+                    rect, label = self._crop_items[used_items]
+                    self.canvas.coords(rect, left, top, right, bottom)
+                    self.canvas.coords(label, center_x, center_y)
+                    self.canvas.itemconfigure(label, text=f"#{i+1}")
+                    self.canvas.itemconfigure(rect, state=tk.NORMAL)
+                    self.canvas.itemconfigure(label, state=tk.NORMAL)
+                else:
+                    rect = self.canvas.create_rectangle(
+                        left, top, right, bottom,
+                        outline="red", width=3, tags="saved_crop", fill=""
+                    )
+                    label = self.canvas.create_text(
+                        center_x, center_y, text=f"#{i+1}",
+                        fill="red", font=("Arial", 12, "bold"), tags="saved_crop"
+                    )
+                    self._crop_items.append((rect, label))
+                self._crop_item_of[i] = (rect, label)
+                used_items += 1
             else:
                 print(f"CROP TOO SMALL: width={width}, height={height}, coords=({left}, {top}, {right}, {bottom})")
+        
+        # Hide pooled items not needed by this redraw
+        for rect, label in self._crop_items[used_items:]:
+            self.canvas.itemconfigure(rect, state=tk.HIDDEN)
+            self.canvas.itemconfigure(label, state=tk.HIDDEN)
                 
     def select_output_directory(self):
         """Select output directory for exported images"""
@@ -1129,15 +1579,41 @@ class PDFViewerApp:
                 foreground="black"
             )
             
+            # List the directory in the background so the export conflict scan does not wait on it
+            threading.Thread(target=self._preflight_output_directory, args=(directory,), daemon=True).start()
+            
+    def _preflight_output_directory(self, directory):
+        """List an output directory in background thread"""
+        try:
+            # Stat before listing so a change made during the listing invalidates it
+            mtime = os.stat(directory).st_mtime_ns
+            names = {os.path.normcase(name) for name in os.listdir(directory)}
+        except OSError:
+            return
+        self._preflight_listdir = (directory, mtime, names)
+        
+    def _get_output_directory_names(self):
+        """Get the normcased file names in the output directory, reusing the preflight listing if still current"""
+        directory = self.output_directory
+        if not os.path.isdir(directory):
+            return set()
+        
+        preflight = self._preflight_listdir
+        if preflight and preflight[0] == directory and preflight[1] == os.stat(directory).st_mtime_ns:
+            return preflight[2]
+        return {os.path.normcase(name) for name in os.listdir(directory)}
+            
     def clear_all_crops(self):
         """Clear all crop selections"""
         if self.crop_selections:
             result = messagebox.askyesno("Confirm", "Clear all crop selections?")
             if result:
+                self.begin_batch()
                 self.crop_selections = []
                 self.crop_history = []
                 self.crop_frame.update_crop_list([])
                 self.redraw_crop_rectangles()
+                self.end_batch()
                 
     def export_all_crops(self):
         """Export all crop selections"""
@@ -1152,7 +1628,7 @@ class PDFViewerApp:
                 return
             
         try:
-            extractor = ImageExtractor(self.pdf_document)
+            extractor = self.extractor
             
             self.status_label.config(text="Exporting crops...")
             self.progress_bar.pack(side=tk.RIGHT, padx=(10, 0))
@@ -1178,10 +1654,22 @@ class PDFViewerApp:
             conflicts = []
             export_queue = []
             
+            # Crops exported before from the same page region of the unchanged PDF are skipped
+            manifest = self._load_export_manifest()
+            pdf_path = extractor.pdf_document.name
+            pdf_mtime = os.path.getmtime(pdf_path) if pdf_path and os.path.isfile(pdf_path) else None
+            unchanged_count = 0
+            
+            # One directory scan instead of a stat per crop (normcase matches Windows' case-insensitive names)
+            existing_names = self._get_output_directory_names()
+            
+            # Parse the naming pattern once for all crops (an invalid one raises on first use as before)
+            format_name = compile_naming_pattern(self.naming_pattern) or self.naming_pattern.format
+            
             for i, crop in enumerate(self.crop_selections):
                 # Generate filename based on naming mode
                 if self.use_sequential_naming:
-                    filename = self.naming_pattern.format(i + 1)
+                    filename = format_name(i + 1)
                     if not filename.endswith('.png'):
                         filename += '.png'
                 else:
@@ -1194,37 +1682,45 @@ class PDFViewerApp:
                         filename += '.png'
                     
                 output_path = os.path.join(self.output_directory, filename)
+                crop_key = self._crop_export_key(crop, pdf_mtime)
                 
-                if os.path.exists(output_path):
-                    unique_path = get_unique_filename(output_path)
+                if os.path.normcase(filename) in existing_names:
+                    if crop_key and manifest.get(filename) == crop_key:
+                        unchanged_count += 1
+                        continue
                     conflicts.append({
                         'crop_index': i,
                         'crop': crop,
+                        'key': crop_key,
                         'original_path': output_path,
-                        'suggested_path': unique_path,
-                        'original_name': os.path.basename(output_path),
-                        'suggested_name': os.path.basename(unique_path)
+                        'original_name': os.path.basename(output_path)
                     })
                 else:
-                    export_queue.append({'crop_index': i, 'crop': crop, 'path': output_path})
+                    export_queue.append({'crop_index': i, 'crop': crop, 'path': output_path, 'key': crop_key})
             
-            # Handle conflicts if any
-            if conflicts:
-                # Ask user about conflicts in main thread and wait for response
-                self.root.after(0, self._handle_batch_conflicts, conflicts, export_queue, extractor)
-            else:
-                # No conflicts, proceed with export
+            # Suggest new names from the same listing, avoiding each other and the names about to be written
+            planned_names = {os.path.normcase(os.path.basename(item['path'])) for item in export_queue}
+            namer = UniqueNamer(self.output_directory, existing_names | planned_names)
+            for conflict in conflicts:
+                conflict['suggested_name'] = namer.reserve_name(conflict['original_name'])
+                conflict['suggested_path'] = os.path.join(self.output_directory, conflict['suggested_name'])
+            
+            self._export_manifest = manifest
+            self._export_unchanged_count = unchanged_count
+            
+            if not conflicts:
+                # No conflicts, export straight from this thread without involving the UI
                 self._process_export_queue(export_queue, extractor)
+                return
+            
+            # Ask user about conflicts in main thread and wait for response
+            self.root.after(0, self._handle_batch_conflicts, conflicts, export_queue, extractor)
             
         except Exception as e:
             self.root.after(0, self._export_error_callback, str(e))
             
     def _handle_batch_conflicts(self, conflicts, export_queue, extractor):
-        """Handle file conflicts during batch export"""
-        if not conflicts:
-            self._process_export_queue(export_queue, extractor)
-            return
-        
+        """Handle file conflicts during batch export (only scheduled when there are conflicts)"""
         # Create dialog to show all conflicts
         conflict_dialog = tk.Toplevel(self.root)
         conflict_dialog.title("File Conflicts")
@@ -1273,30 +1769,57 @@ class PDFViewerApp:
                 'new_name': conflict['suggested_name']
             }
         
+        # In-place editor for the 'New Name' cell, created once and moved over the edited row
+        name_editor = ttk.Entry(tree)
+        editing = {'item': None}
+        
+        def commit_edit(event=None):
+            item = editing['item']
+            if item is None:
+                return
+            editing['item'] = None
+            new_name = name_editor.get().strip()
+            name_editor.place_forget()
+            
+            if new_name:
+                # Ensure .png extension
+                if not new_name.endswith('.png'):
+                    new_name += '.png'
+                
+                # Update the display and stored data
+                conflict_data[item]['new_name'] = new_name
+                tree.set(item, 'new_name', new_name)
+        
+        def cancel_edit(event=None):
+            editing['item'] = None
+            name_editor.place_forget()
+        
         # Double-click to rename
         def on_double_click(event):
-            item = tree.selection()[0] if tree.selection() else None
-            if item and item in conflict_data:
-                current_name = conflict_data[item]['new_name']
-                # Remove .png extension for editing
-                base_name = current_name[:-4] if current_name.endswith('.png') else current_name
-                
-                new_name = simpledialog.askstring("Rename File", 
-                    f"Enter new name for {conflict_data[item]['conflict']['original_name']}:",
-                    initialvalue=base_name)
-                
-                if new_name:
-                    # Ensure .png extension
-                    if not new_name.endswith('.png'):
-                        new_name += '.png'
-                    
-                    # Update the display and stored data
-                    conflict_data[item]['new_name'] = new_name
-                    tree.item(item, values=(
-                        tree.item(item, 'values')[0],  # Keep crop number
-                        tree.item(item, 'values')[1],  # Keep existing name
-                        new_name
-                    ))
+            commit_edit()
+            item = tree.identify_row(event.y)
+            if not item or item not in conflict_data:
+                return
+            bbox = tree.bbox(item, 'new_name')
+            if not bbox:
+                return
+            
+            current_name = conflict_data[item]['new_name']
+            # Remove .png extension for editing
+            base_name = current_name[:-4] if current_name.endswith('.png') else current_name
+            
+            x, y, width, height = bbox
+            name_editor.delete(0, tk.END)
+            name_editor.insert(0, base_name)
+            name_editor.select_range(0, tk.END)
+            name_editor.place(x=x, y=y, width=width, height=height)
+            name_editor.focus_set()
+            editing['item'] = item
+        
+        name_editor.bind('<Return>', commit_edit)
+        name_editor.bind('<KP_Enter>', commit_edit)
+        name_editor.bind('<FocusOut>', commit_edit)
+        name_editor.bind('<Escape>', cancel_edit)
         
         tree.bind('<Double-1>', on_double_click)
         
@@ -1319,6 +1842,7 @@ class PDFViewerApp:
         result = {'action': None, 'conflict_data': conflict_data}
         
         def use_new_names():
+            commit_edit()
             result['action'] = 'rename'
             conflict_dialog.destroy()
             
@@ -1351,7 +1875,8 @@ class PDFViewerApp:
                 export_queue.append({
                     'crop_index': conflict['crop_index'],
                     'crop': conflict['crop'],
-                    'path': new_path
+                    'path': new_path,
+                    'key': conflict['key']
                 })
         elif result['action'] == 'skip':
             # Don't add conflicts to export queue
@@ -1367,22 +1892,115 @@ class PDFViewerApp:
         """Process the export queue"""
         try:
             exported_count = 0
+            exported_items = []
+            pdf_path = extractor.pdf_document.name
             
+            # Crops on the same page share one page render
+            page_groups = {}
             for item in export_queue:
-                crop = item['crop']
-                output_path = item['path']
-                
-                # Extract and save crop
-                metadata = extractor.extract_crop(crop, output_path)
-                if metadata:
-                    exported_count += 1
+                page_groups.setdefault(item['crop']['page'], []).append(item)
+            
+            if len(page_groups) > 1 and pdf_path and os.path.isfile(pdf_path):
+                # Extract pages in parallel, each worker process opening the PDF itself
+                max_workers = min(os.cpu_count() or 1, len(page_groups))
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=_SPAWN_CONTEXT) as pool:
+                    futures = {
+                        pool.submit(extract_page_crops_from_file, pdf_path,
+                                    [(item['crop'], item['path']) for item in group]): group
+                        for group in page_groups.values()
+                    }
+                    for future in as_completed(futures):
+                        for item, success in zip(futures[future], future.result()):
+                            if success:
+                                exported_count += 1
+                                exported_items.append(item)
+            else:
+                # Extract on this thread's own document handle so page renders are never blocked
+                with self._open_background_document(extractor.pdf_document) as pdf_document:
+                    background_extractor = ImageExtractor(pdf_document)
+                    for group in page_groups.values():
+                        # Extract and save the page's crops
+                        results = background_extractor.extract_page_crops(
+                            [(item['crop'], item['path']) for item in group]
+                        )
+                        for item, metadata in zip(group, results):
+                            if metadata:
+                                exported_count += 1
+                                exported_items.append(item)
+            
+            # Remember what was written so the next export can skip unchanged crops
+            manifest = self._export_manifest
+            for item in exported_items:
+                if item.get('key'):
+                    manifest[os.path.basename(item['path'])] = item['key']
+            if exported_items:
+                self._save_export_manifest(manifest)
                     
             # Update UI in main thread
+            exported_count += self._export_unchanged_count
             self.root.after(0, self._export_complete_callback, exported_count, len(self.crop_selections))
             
         except Exception as e:
             self.root.after(0, self._export_error_callback, str(e))
     
+    def _open_background_document(self, pdf_document):
+        """
+        Open a separate handle on a document for use by a background thread
+        
+        The shared document is only touched briefly under the render lock (to copy it
+        when it has no file), so extraction on the returned handle never stalls the UI.
+        
+        Args:
+            pdf_document: Open document shared with the UI thread
+            
+        Returns:
+            fitz.Document: New document the caller must close
+        """
+        pdf_path = pdf_document.name
+        if pdf_path and os.path.isfile(pdf_path):
+            return fitz.open(pdf_path)
+        with self._render_lock:
+            data = pdf_document.tobytes()
+        return fitz.open(stream=data, filetype="pdf")
+    
+    def _crop_export_key(self, crop, pdf_mtime):
+        """
+        Get the key identifying a crop's exported content
+        
+        Args:
+            crop: Crop selection dictionary
+            pdf_mtime: Modification time of the source PDF, or None if it has no file
+            
+        Returns:
+            str: Hex digest of page, region and source mtime, or None without a source file
+        """
+        if pdf_mtime is None:
+            return None
+        coords = crop.get('pdf_coords', crop['coords'])
+        data = repr((crop['page'], tuple(coords), pdf_mtime)).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    def _load_export_manifest(self):
+        """Load the export manifest of the output directory (empty if missing or unreadable)"""
+        manifest_path = os.path.join(self.output_directory, EXPORT_MANIFEST_NAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def _save_export_manifest(self, manifest):
+        """Write the export manifest of the output directory"""
+        manifest_path = os.path.join(self.output_directory, EXPORT_MANIFEST_NAME)
+        try:
+            temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_path, manifest_path)
+        except OSError as e:
+            log_error(f"Failed to write export manifest: {e}", "Export")
+    
     def _export_complete_callback(self, exported_count, total_count):
         """Callback when export is complete"""
         self.progress_bar.stop()
@@ -1422,8 +2040,22 @@ class PDFViewerApp:
         """Remove a specific crop selection"""
         if 0 <= index < len(self.crop_selections):
             self.crop_selections.pop(index)
-            self.crop_frame.update_crop_list(self.crop_selections)
+            self._remove_crop_display(index)
+            
+    def _remove_crop_display(self, index):
+        """Update the crop list and canvas after the crop at index was removed"""
+        self.crop_frame.pop_crop(self.crop_selections, index)
+        
+        if index < len(self.crop_selections):
+            # Later crops were renumbered, their labels must be redrawn
             self.redraw_crop_rectangles()
+            return
+        
+        # The last crop was removed: hide its items, nothing else changes
+        items = self._crop_item_of.pop(index, None)
+        if items and self.canvas.type(items[0]):
+            for item in items:
+                self.canvas.itemconfigure(item, state=tk.HIDDEN)
             
     def save_individual_crop(self, crop_index):
         """Save an individual crop with custom filename and location"""
@@ -1452,18 +2084,34 @@ class PDFViewerApp:
         
         if not file_path:
             return  # User cancelled
+        
+        # Check if file already exists and ask user here, Tk dialogs must not run on the save thread
+        if os.path.exists(file_path):
+            unique_path = get_unique_filename(file_path)
+            suggested_name = os.path.basename(unique_path)
+            original_name = os.path.basename(file_path)
+            
+            response = messagebox.askyesno("File Exists", 
+                f"File '{original_name}' already exists.\n\nUse suggested name '{suggested_name}' instead?")
+            
+            if not response:
+                # User declined, don't save
+                return
+                
+            file_path = unique_path
             
         try:
             self.status_label.config(text="Saving crop...")
             self.progress_bar.pack(side=tk.RIGHT, padx=(10, 0))
             self.progress_bar.start()
             
+            # Worker processes render and encode saves so several saves use several cores
+            if self._save_pool is None:
+                self._save_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_SPAWN_CONTEXT)
+                atexit.register(self._save_pool.shutdown, wait=False, cancel_futures=True)
+            
             # Save in background thread
-            threading.Thread(
-                target=self._save_individual_crop_thread,
-                args=(crop, file_path, crop_index + 1),
-                daemon=True
-            ).start()
+            self._io_queue.put((self._save_individual_crop_thread, (crop, file_path, crop_index + 1)))
             
         except Exception as e:
             self.progress_bar.stop()
@@ -1471,36 +2119,45 @@ class PDFViewerApp:
             self.status_label.config(text="Ready")
             messagebox.showerror("Save Error", f"Failed to save crop: {str(e)}")
             
-    def _save_individual_crop_thread(self, crop, file_path, crop_number):
+    def _io_worker(self):
+        """Run queued background jobs one after another"""
+        while True:
+            job, args = self._io_queue.get()
+            try:
+                job(*args)
+            except Exception as e:
+                # Jobs report their own errors; keep the worker alive regardless
+                log_error(f"Background job failed: {e}", "Save")
+            
+    def _save_individual_crop_thread(self, crop, final_path, crop_number):
         """Save individual crop in background thread"""
         try:
-            # Check if file already exists and ask user
-            if os.path.exists(file_path):
-                unique_path = get_unique_filename(file_path)
-                suggested_name = os.path.basename(unique_path)
-                original_name = os.path.basename(file_path)
-                
-                response = messagebox.askyesno("File Exists", 
-                    f"File '{original_name}' already exists.\n\nUse suggested name '{suggested_name}' instead?")
-                
-                if not response:
-                    # User declined, don't save
-                    self.root.after(0, self._individual_save_cancelled_callback)
-                    return
-                    
-                final_path = unique_path
-            else:
-                final_path = file_path
-            
-            extractor = ImageExtractor(self.pdf_document)
-            metadata = extractor.extract_crop(crop, final_path)
+            pdf_path = self.extractor.pdf_document.name
+            if not pdf_path or not os.path.isfile(pdf_path):
+                # No file for a worker process to open, extract in this thread on its own handle
+                with self._open_background_document(self.extractor.pdf_document) as pdf_document:
+                    metadata = ImageExtractor(pdf_document).extract_crop(crop, final_path)
+                self.root.after(0, self._individual_save_complete_callback, metadata, final_path, crop_number)
+                return
             
-            # Update UI in main thread with the actual path used
-            self.root.after(0, self._individual_save_complete_callback, metadata, final_path, crop_number)
+            # Update UI in main thread with the actual path used once the worker finishes
+            future = self._save_pool.submit(extract_crop_from_file, pdf_path, crop, final_path)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._individual_save_done_callback, f, final_path, crop_number)
+            )
             
         except Exception as e:
             self.root.after(0, self._individual_save_error_callback, str(e), crop_number)
             
+    def _individual_save_done_callback(self, future, file_path, crop_number):
+        """Callback when an individual crop save worker finishes"""
+        try:
+            metadata = future.result()
+        except Exception as e:
+            self._individual_save_error_callback(str(e), crop_number)
+            return
+        self._individual_save_complete_callback(metadata, file_path, crop_number)
+            
     def _individual_save_complete_callback(self, metadata, file_path, crop_number):
         """Callback when individual crop save is complete"""
         self.progress_bar.stop()
@@ -1525,16 +2182,7 @@ class PDFViewerApp:
                                
     def _get_quality_rating(self, dpi):
         """Get quality rating based on DPI"""
-        if dpi >= 600:
-            return "Excellent (Print Ready)"
-        elif dpi >= 300:
-            return "Very Good (Print Quality)"
-        elif dpi >= 200:
-            return "Good (Web/Screen)"
-        elif dpi >= 150:
-            return "Fair (Low Print)"
-        else:
-            return "Poor (Screen Only)"
+        return get_quality_rating(dpi)
             
     def _individual_save_error_callback(self, error_msg, crop_number):
         """Callback when individual crop save fails"""
@@ -1544,28 +2192,20 @@ class PDFViewerApp:
         messagebox.showerror("Save Error", 
                            f"Failed to save crop #{crop_number}: {error_msg}")
                            
-    def _individual_save_cancelled_callback(self):
-        """Callback when individual crop save is cancelled by user"""
-        self.progress_bar.stop()
-        self.progress_bar.pack_forget()
-        self.status_label.config(text="Ready")
-    
     def load_pdf_from_url(self):
         """Load PDF from URL with streamlined interface"""
         # Create a custom dialog for better UX
         dialog = tk.Toplevel(self.root)
         dialog.title("Load PDF from URL")
-        dialog.geometry("500x150")
+        
+        # Size and center the dialog in one step; the size is fixed, so no layout pass is needed
+        screen_width = dialog.winfo_screenwidth()
+        screen_height = dialog.winfo_screenheight()
+        dialog.geometry(f"500x150+{(screen_width - 500) // 2}+{(screen_height - 150) // 2}")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
         
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-        
         # Dialog content
         main_frame = ttk.Frame(dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -1617,64 +2257,106 @@ class PDFViewerApp:
         if not url:
             return
             
+        # Only fetch web URLs; other schemes (file://, ftp://) can block the download worker
+        if urllib.parse.urlparse(url).scheme.lower() not in ('http', 'https'):
+            messagebox.showerror("Error", "Please enter an http:// or https:// URL")
+            return
+            
         # Convert Google Drive share links to direct download links automatically (silent)
-        if "drive.google.com" in url and "/file/d/" in url:
-            # Extract file ID from various Google Drive URL formats
-            file_id = url.split("/file/d/")[1].split("/")[0]
-            url = f"https://drive.google.com/uc?export=download&id={file_id}"
+        drive_match = _GDRIVE_RE.search(url)
+        if drive_match:
+            url = f"https://drive.google.com/uc?export=download&id={drive_match.group(1)}"
         elif "drive.google.com" in url:
             # Handle other Google Drive formats
-            if "/view" in url:
-                url = url.replace("/view?usp=sharing", "/export?format=pdf")
-                url = url.replace("/view?usp=drivesdk", "/export?format=pdf")  
-                url = url.replace("/view", "/export?format=pdf")
+            for needle, replacement in _DRIVE_VIEW_REWRITES:
+                if needle in url:
+                    url = url.replace(needle, replacement)
+                    break
         
         self.status_label.config(text="Downloading PDF...")
         self.progress_bar.pack(side=tk.RIGHT, padx=(10, 0))
         self.progress_bar.start()
         
-        # Download in background thread
+        # Download in its own background thread so a slow server never holds up queued saves
         threading.Thread(target=self._download_pdf_thread, args=(url,), daemon=True).start()
         
     def _download_pdf_thread(self, url):
         """Download PDF from URL in background thread"""
+        temp_path = None
         try:
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            # Download file
-            with urllib.request.urlopen(url) as response:
-                with open(temp_path, 'wb') as f:
-                    shutil.copyfileobj(response, f)
+            # Stream the response into a temporary file, reporting progress when the size is known
+            with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, \
+                    tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+                temp_path = temp_file.name
+                total_bytes = int(response.headers.get('Content-Length') or 0)
+                downloaded_bytes = 0
+                while True:
+                    chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    temp_file.write(chunk)
+                    downloaded_bytes += len(chunk)
+                    if total_bytes:
+                        self.root.after(0, self._update_download_progress, downloaded_bytes, total_bytes)
             
             # Load the downloaded PDF
             self.root.after(0, self._pdf_download_complete_callback, temp_path, url)
             
         except Exception as e:
-            self.root.after(0, self._pdf_download_error_callback, str(e))
+            # Clean up partial download
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            # Read timeouts raise socket.timeout directly, connect timeouts arrive wrapped in URLError
+            timed_out = isinstance(e, socket.timeout) or (
+                isinstance(e, urllib.error.URLError) and isinstance(e.reason, socket.timeout)
+            )
+            if timed_out:
+                message = f"Connection timed out after {DOWNLOAD_TIMEOUT} seconds"
+            else:
+                message = str(e)
+            self.root.after(0, self._pdf_download_error_callback, message)
             
+    def _update_download_progress(self, downloaded_bytes, total_bytes):
+        """Show download progress, switching the progress bar to determinate mode on first use"""
+        if str(self.progress_bar.cget('mode')) != 'determinate':
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate', maximum=total_bytes)
+        self.progress_bar.config(value=min(downloaded_bytes, total_bytes))
+        self.status_label.config(
+            text=f"Downloading PDF... {format_file_size(downloaded_bytes)} of {format_file_size(total_bytes)}"
+        )
+        
     def _pdf_download_complete_callback(self, temp_path, url):
         """Callback when PDF download is complete"""
         try:
             # Load the PDF
             self.pdf_document = fitz.open(temp_path)
+            self.extractor = ImageExtractor(self.pdf_document)
+            self._cached_metadata = dict(self.pdf_document.metadata or {})
             self.current_file_path = temp_path  # Store temp path for default naming
             self.current_page = 0
-            self.pdf_images = []
+            self._page_cache.clear()
+            self._search_cache.clear()
+            self._set_disk_cache_dir(temp_path)
+            self.begin_batch()
             self.crop_selections = []
             self.crop_history = []
             
             # Update UI
             self.progress_bar.stop()
             self.progress_bar.pack_forget()
+            self.progress_bar.config(mode='indeterminate')
             
             # Extract filename from URL for display
             parsed_url = urllib.parse.urlparse(url)
             filename = os.path.basename(parsed_url.path) or "downloaded_pdf.pdf"
             if not filename.endswith('.pdf'):
                 filename += '.pdf'
+            # URL basenames like "uc" or "export" are shared by unrelated documents, key by the whole URL
+            self._apply_saved_naming_pattern(url)
                 
             self.status_label.config(text=f"Loaded: {filename}")
             
@@ -1689,6 +2371,7 @@ class PDFViewerApp:
                 self.render_continuous_pages()
             else:
                 self.render_current_page()
+            self.end_batch()
             
             # Update navigation
             self.update_navigation()
@@ -1698,8 +2381,10 @@ class PDFViewerApp:
                 self.highlight_visualization_keywords()
             
         except Exception as e:
+            self.end_batch()
             self.progress_bar.stop()
             self.progress_bar.pack_forget()
+            self.progress_bar.config(mode='indeterminate')
             self.status_label.config(text="Ready")
             messagebox.showerror("Error", f"Failed to load downloaded PDF: {str(e)}")
             # Clean up temp file
@@ -1712,13 +2397,13 @@ class PDFViewerApp:
         """Callback when PDF download fails"""
         self.progress_bar.stop()
         self.progress_bar.pack_forget()
+        self.progress_bar.config(mode='indeterminate')
         self.status_label.config(text="Ready")
         messagebox.showerror("Download Error", f"Failed to download PDF: {error_msg}")
         
     def update_pdf_info_from_url(self, url, file_path):
         """Update PDF info display for URL-loaded PDF"""
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete(1.0, tk.END)
+        self._info_last_path = None  # Panel no longer describes a local file
         
         try:
             # Get basic file info
@@ -1731,18 +2416,15 @@ class PDFViewerApp:
             info += f"Size: {size_mb:.1f} MB\n"
             
             # Get PDF metadata if available
-            if self.pdf_document:
-                metadata = self.pdf_document.metadata
-                if metadata and metadata.get('title'):
-                    info += f"Title: {metadata['title']}\n"
-                if metadata and metadata.get('author'):
-                    info += f"Author: {metadata['author']}\n"
-                
-            self.info_text.insert(tk.END, info)
+            metadata = self._cached_metadata
+            if metadata.get('title'):
+                info += f"Title: {metadata['title']}\n"
+            if metadata.get('author'):
+                info += f"Author: {metadata['author']}\n"
         except Exception as e:
-            self.info_text.insert(tk.END, f"Error reading PDF info: {str(e)}")
+            info = f"Error reading PDF info: {str(e)}"
             
-        self.info_text.config(state=tk.DISABLED)
+        self._set_info_text(info)
         
 
         
@@ -1756,9 +2438,8 @@ class PDFViewerApp:
         if last_crop_index < len(self.crop_selections):
             self.crop_selections.pop(last_crop_index)
             
-            # Update crop list and redraw
-            self.crop_frame.update_crop_list(self.crop_selections)
-            self.redraw_crop_rectangles()
+            # Update crop list and canvas for the removed crop only
+            self._remove_crop_display(last_crop_index)
             
     def delete_selected_crop(self):
         """Delete the currently selected crop"""
@@ -1837,25 +2518,77 @@ class PDFViewerApp:
         if not self.naming_learning_enabled or not new_name or not old_name:
             return
         
+        # Names the user chose are never overwritten by learned patterns
+        self.crop_selections[crop_index]['manual_rename'] = True
+        
         # Extract patterns from the rename
         pattern = self._extract_naming_pattern(crop_index, old_name, new_name)
         if pattern:
             self.learned_naming_prefix = pattern['prefix']
             self.learned_naming_pattern = pattern['full_pattern']
             print(f"DEBUG: Learned naming pattern: '{self.learned_naming_pattern}' from '{old_name}' -> '{new_name}'")
-            
-            # Update subsequent crops that haven't been manually renamed
-            self._update_subsequent_crop_names(crop_index)
+            self._save_naming_pattern()
+            
+            # Update subsequent crops that haven't been manually renamed, once a burst of renames settles
+            if self._rename_after_id:
+                self.root.after_cancel(self._rename_after_id)
+            if self._rename_from_index is None or crop_index < self._rename_from_index:
+                self._rename_from_index = crop_index
+            self._rename_after_id = self.root.after(150, self._flush_rename_propagation)
         else:
             print(f"DEBUG: Could not extract pattern from '{old_name}' -> '{new_name}'")
     
+    def _load_naming_patterns(self):
+        """Load naming patterns learned in earlier sessions (empty if missing or unreadable)"""
+        try:
+            with open(NAMING_PATTERNS_PATH, 'r', encoding='utf-8') as f:
+                patterns = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return patterns if isinstance(patterns, dict) else {}
+    
+    def _apply_saved_naming_pattern(self, pattern_key):
+        """Use the naming pattern learned for this PDF in an earlier session, or none if there is none"""
+        self._pattern_key = pattern_key
+        saved = self._pattern_cache.get(pattern_key)
+        if isinstance(saved, dict) and saved.get('pattern'):
+            self.learned_naming_prefix = saved.get('prefix', "")
+            self.learned_naming_pattern = saved['pattern']
+        else:
+            # Don't carry the previous document's pattern over
+            self.learned_naming_prefix = ""
+            self.learned_naming_pattern = ""
+    
+    def _save_naming_pattern(self):
+        """Store the learned naming pattern of the current PDF for later sessions"""
+        if not self._pattern_key:
+            return
+        self._pattern_cache[self._pattern_key] = {
+            'prefix': self.learned_naming_prefix,
+            'pattern': self.learned_naming_pattern,
+        }
+        try:
+            os.makedirs(os.path.dirname(NAMING_PATTERNS_PATH), exist_ok=True)
+            temp_path = f"{NAMING_PATTERNS_PATH}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._pattern_cache, f, indent=2)
+            os.replace(temp_path, NAMING_PATTERNS_PATH)
+        except OSError as e:
+            log_error(f"Failed to save naming patterns: {e}", "Naming")
+    
+    def _flush_rename_propagation(self):
+        """Apply the latest learned pattern after the earliest crop renamed in the burst"""
+        crop_index = self._rename_from_index
+        self._rename_after_id = None
+        self._rename_from_index = None
+        if crop_index is not None:
+            self._update_subsequent_crop_names(crop_index)
+    
     def _extract_naming_pattern(self, crop_index, old_name, new_name):
         """Extract naming pattern from user rename"""
-        import re
-        
         # Look for number patterns in both names
-        old_numbers = re.findall(r'\d+', old_name)
-        new_numbers = re.findall(r'\d+', new_name)
+        old_numbers = _DIGITS_RE.findall(old_name)
+        new_numbers = _DIGITS_RE.findall(new_name)
         
         if not old_numbers or not new_numbers:
             # If no numbers, just use the new name as a prefix pattern
@@ -1923,9 +2656,12 @@ class PDFViewerApp:
         if not self.learned_naming_pattern:
             return
         
-        updated = False
+        first_updated = None
+        last_updated = None
         for i in range(changed_crop_index + 1, len(self.crop_selections)):
             crop = self.crop_selections[i]
+            if crop.get('manual_rename'):
+                continue
             current_name = crop.get('custom_name', '')
             
             # Check if this crop still has a default-style name (not manually renamed by user)
@@ -1933,24 +2669,20 @@ class PDFViewerApp:
                 try:
                     new_name = self.learned_naming_pattern.format(i + 1)
                     crop['custom_name'] = new_name
-                    updated = True
+                    if first_updated is None:
+                        first_updated = i
+                    last_updated = i
                 except:
                     break
         
-        if updated:
-            # Update the crop list display
-            self.crop_frame.update_crop_list(self.crop_selections)
+        if first_updated is not None:
+            # Refresh only the list entries that changed
+            self.crop_frame.update_crop_names_range(self.crop_selections, first_updated, last_updated)
     
     def _is_default_style_name(self, name, crop_index):
         """Check if a name appears to be a default-generated name"""
         if not name:
             return True
         
-        # Check if it matches the default pattern
-        default_name = self.get_default_crop_name()
-        expected_number = crop_index + 1
-        
         # Simple heuristic: if it contains Q followed by the expected number, it's likely default
-        import re
-        pattern = f"Q{expected_number:02d}"
-        return pattern in name
+        return f"Q{crop_index + 1:02d}" in name
@@ -5,6 +5,68 @@ UI Components - Reusable UI components for the PDF viewer
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import re
+from functools import lru_cache
+from image_extractor import ImageExtractor
+from utils import compile_naming_pattern
+
+# Crop list row templates: index, [name,] page, width, height, quality indicator
+_NAMED_ROW_TEMPLATE = "#{0}: {1} - Page {2} ({3}×{4}){5}"
+_PLAIN_ROW_TEMPLATE = "#{0}: Page {1} ({2}×{3}){4}"
+
+# Crop list quality indicators by DPI, built once per distinct DPI
+_QUALITY_SUFFIX_CACHE = {}
+
+def _quality_suffix(dpi):
+    """Get the short quality indicator shown after a crop list row"""
+    suffix = _QUALITY_SUFFIX_CACHE.get(dpi)
+    if suffix is None:
+        if dpi >= 300:
+            suffix = f" [{dpi} DPI ✓]"
+        elif dpi >= 200:
+            suffix = f" [{dpi} DPI ~]"
+        else:
+            suffix = f" [{dpi} DPI !]"
+        _QUALITY_SUFFIX_CACHE[dpi] = suffix
+    return suffix
+
+@lru_cache(maxsize=128)
+def _compute_preview(pattern):
+    """
+    Build the naming preview text for a pattern
+    
+    Args:
+        pattern: Naming pattern such as "Q{:02d}"
+        
+    Returns:
+        tuple: (preview_text, color) for the preview label
+    """
+    format_name = compile_naming_pattern(pattern)
+    if format_name is None:
+        return "(invalid pattern)", "red"
+        
+    try:
+        # Generate preview with sample numbers
+        samples = []
+        for i in range(1, 4):
+            try:
+                filename = format_name(i)
+                if not filename.endswith('.png'):
+                    filename += '.png'
+                samples.append(filename)
+            except:
+                samples.append("(invalid pattern)")
+                break
+                
+        if len(samples) == 3 and "(invalid pattern)" not in samples:
+            preview = f"{samples[0]}, {samples[1]}, ..."
+        else:
+            preview = samples[0] if samples else "(invalid pattern)"
+            
+        return preview, "gray" if "(invalid" not in preview else "red"
+        
+    except Exception:
+        return "(invalid pattern)", "red"
 
 class CropFrame(ttk.LabelFrame):
     """Frame for managing crop selections"""
@@ -12,6 +74,15 @@ class CropFrame(ttk.LabelFrame):
     def __init__(self, parent, app):
         super().__init__(parent, text="Crop Selections", padding=10)
         self.app = app
+        self._extractor = None  # ImageExtractor reused while the app's document is unchanged
+        self._extractor_doc = None  # Document _extractor was created for
+        self._current_rows = []  # Texts currently shown in crop_listbox, row by row
+        self.show_quality = True  # Whether rows show the estimated DPI of each crop
+        self._btn_state = tk.DISABLED  # State last applied to the per-crop buttons
+        self._last_selection = None  # Listbox selection last handled by on_selection_change
+        self._rename_dialog = None  # Rename dialog, built on first use and hidden between renames
+        self._rename_crop_index = None  # Crop the rename dialog is currently naming
+        self._rename_current_name = None  # Name of that crop when the dialog was opened
         self.setup_ui()
         
     def setup_ui(self):
@@ -22,11 +93,11 @@ class CropFrame(ttk.LabelFrame):
         
         # Scrollable listbox for crops
         self.crop_listbox = tk.Listbox(list_frame, height=6, selectmode=tk.SINGLE)
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.crop_listbox.yview)
-        self.crop_listbox.configure(yscrollcommand=scrollbar.set)
+        self._scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.crop_listbox.yview)
+        self.crop_listbox.configure(yscrollcommand=self._scrollbar.set)
         
         self.crop_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Crop management buttons
         button_frame = ttk.Frame(self)
@@ -103,57 +174,170 @@ class CropFrame(ttk.LabelFrame):
         
     def update_crop_list(self, crop_selections, scroll_to_end=False):
         """Update the crop list display with quality information"""
-        self.crop_listbox.delete(0, tk.END)
+        extractor = self._get_row_extractor()
+        new_rows = [self._format_crop_item(i, crop, extractor) for i, crop in enumerate(crop_selections)]
+        selection = self.crop_listbox.curselection()
         
-        for i, crop in enumerate(crop_selections):
-            page_num = crop['page'] + 1  # 1-based for display
-            coords = crop['coords']
-            width = int(coords[2] - coords[0])
-            height = int(coords[3] - coords[1])
-            
-            # Get quality preview if PDF document available
-            quality_info = ""
-            if hasattr(self.app, 'pdf_document') and self.app.pdf_document:
-                try:
-                    from image_extractor import ImageExtractor
-                    extractor = ImageExtractor(self.app.pdf_document)
-                    preview_info = extractor.get_crop_preview_info(crop)
-                    if preview_info:
-                        dpi = preview_info['estimated_dpi']
-                        # Short quality indicator
-                        if dpi >= 300:
-                            quality_info = f" [{dpi} DPI ✓]"
-                        elif dpi >= 200:
-                            quality_info = f" [{dpi} DPI ~]"
-                        else:
-                            quality_info = f" [{dpi} DPI !]"
-                except Exception:
-                    pass
-            
-            # Check if crop has custom name
-            if 'custom_name' in crop and crop['custom_name']:
-                crop_name = crop['custom_name']
-                item_text = f"#{i+1}: {crop_name} - Page {page_num} ({width}×{height}){quality_info}"
-            else:
-                item_text = f"#{i+1}: Page {page_num} ({width}×{height}){quality_info}"
-            self.crop_listbox.insert(tk.END, item_text)
+        # Only replace rows whose text changed, then add or drop rows at the end.
+        # The scrollbar is detached meanwhile and updated once afterwards.
+        current_rows = self._current_rows
+        self.crop_listbox.configure(yscrollcommand='')
+        try:
+            for i in range(min(len(new_rows), len(current_rows))):
+                if new_rows[i] != current_rows[i]:
+                    self.crop_listbox.delete(i)
+                    self.crop_listbox.insert(i, new_rows[i])
+            if len(new_rows) > len(current_rows):
+                self.crop_listbox.insert(tk.END, *new_rows[len(current_rows):])
+            elif len(new_rows) < len(current_rows):
+                self.crop_listbox.delete(len(new_rows), tk.END)
+        finally:
+            self.crop_listbox.configure(yscrollcommand=self._scrollbar.set)
+            self._scrollbar.set(*self.crop_listbox.yview())
+        self._current_rows = new_rows
+        self._last_selection = None
+        
+        # Replaced rows lose their selection, restore it
+        for index in selection:
+            if index < len(new_rows):
+                self.crop_listbox.selection_set(index)
             
         # Auto-scroll to end when requested (for new crops)
         if scroll_to_end and len(crop_selections) > 0:
             self.crop_listbox.see(tk.END)
             
-        # Update button states
-        self.remove_btn.config(state=tk.DISABLED)
-        self.save_individual_btn.config(state=tk.DISABLED)
-        self.rename_btn.config(state=tk.DISABLED)
+        self._update_button_states()
+        
+    def set_show_quality(self, show_quality):
+        """Show or hide the DPI indicators of the crop list rows"""
+        self.show_quality = show_quality
+        self.update_crop_list(self.app.crop_selections)
+        
+    def _update_button_states(self):
+        """Enable the per-crop buttons only while a crop is selected"""
+        self._set_btns(tk.NORMAL if self.crop_listbox.curselection() else tk.DISABLED)
+        
+    def _set_btns(self, state):
+        """Set the state of the per-crop buttons, skipping the update if it is unchanged"""
+        if state == self._btn_state:
+            return
+        self._btn_state = state
+        self.remove_btn.config(state=state)
+        self.save_individual_btn.config(state=state)
+        self.rename_btn.config(state=state)
+        
+    def update_crop_names_range(self, crop_selections, start, end):
+        """
+        Refresh the list entries of crops start..end (inclusive) after they were renamed
+        
+        Args:
+            crop_selections: List of crop selections
+            start: Index of the first changed crop
+            end: Index of the last changed crop
+        """
+        selection = self.crop_listbox.curselection()
+        extractor = self._get_row_extractor()
+        item_texts = [self._format_crop_item(i, crop_selections[i], extractor) for i in range(start, end + 1)]
+        self.crop_listbox.delete(start, end)
+        self.crop_listbox.insert(start, *item_texts)
+        self._current_rows[start:end + 1] = item_texts
+        
+        # Reinserted rows lose their selection, restore it
+        for index in selection:
+            if start <= index <= end:
+                self.crop_listbox.selection_set(index)
+        
+    def pop_crop(self, crop_selections, index):
+        """
+        Remove the list entry of a removed crop and renumber the entries after it
+        
+        Args:
+            crop_selections: List of crop selections, with the crop already removed
+            index: Index the removed crop had
+        """
+        self.crop_listbox.delete(index)
+        del self._current_rows[index]
+        self._last_selection = None
+        if index < len(crop_selections):
+            self.update_crop_names_range(crop_selections, index, len(crop_selections) - 1)
+            
+        self._update_button_states()
+        
+    def _get_extractor(self):
+        """Get the ImageExtractor for the app's current document, or None without a document"""
+        pdf_document = getattr(self.app, 'pdf_document', None)
+        if not pdf_document:
+            return None
+        if self._extractor_doc is not pdf_document:
+            self._extractor = ImageExtractor(pdf_document)
+            self._extractor_doc = pdf_document
+        return self._extractor
+        
+    def _get_row_extractor(self):
+        """Get the extractor for crop list quality indicators, or None when they are not shown"""
+        return self._get_extractor() if self.show_quality else None
+        
+    def _get_preview_info(self, crop, extractor=None):
+        """
+        Get quality preview info for a crop, cached on the crop until its region changes
+        
+        Args:
+            crop: Crop selection dictionary
+            extractor: Extractor of the current document (looked up if not given)
+            
+        Returns:
+            dict: Preview information, or None without a document or on failure
+        """
+        if extractor is None:
+            extractor = self._get_extractor()
+            if extractor is None:
+                return None
+            
+        key = (crop['page'], tuple(crop.get('pdf_coords', crop['coords'])), crop.get('zoom'))
+        if crop.get('_preview_key') != key:
+            crop['_preview_info'] = extractor.get_crop_preview_info(crop)
+            crop['_preview_key'] = key
+        return crop['_preview_info']
+        
+    def _format_crop_item(self, i, crop, extractor):
+        """
+        Build the list entry text for a crop, with its quality indicator
+        
+        Args:
+            i: Index of the crop
+            crop: Crop selection dictionary
+            extractor: Extractor for the quality indicator, or None to leave it out
+        """
+        page_num = crop['page'] + 1  # 1-based for display
+        coords = crop['coords']
+        width = int(coords[2] - coords[0])
+        height = int(coords[3] - coords[1])
+        
+        # Get quality preview if PDF document available
+        quality_info = ""
+        if extractor is not None:
+            try:
+                preview_info = self._get_preview_info(crop, extractor)
+                if preview_info:
+                    quality_info = _quality_suffix(preview_info['estimated_dpi'])
+            except Exception:
+                pass
+        
+        # Check if crop has custom name
+        crop_name = crop.get('custom_name')
+        if crop_name:
+            return _NAMED_ROW_TEMPLATE.format(i + 1, crop_name, page_num, width, height, quality_info)
+        return _PLAIN_ROW_TEMPLATE.format(i + 1, page_num, width, height, quality_info)
         
     def on_selection_change(self, event):
         """Handle crop selection changes"""
         selection = self.crop_listbox.curselection()
+        if selection == self._last_selection:
+            return
+        self._last_selection = selection
+        
         if selection:
-            self.remove_btn.config(state=tk.NORMAL)
-            self.save_individual_btn.config(state=tk.NORMAL)
-            self.rename_btn.config(state=tk.NORMAL)
+            self._set_btns(tk.NORMAL)
             
             # Navigate to the page containing the selected crop
             crop_index = selection[0]
@@ -164,17 +348,20 @@ class CropFrame(ttk.LabelFrame):
                     self.app.render_current_page()
                     self.app.update_navigation()
         else:
-            self.remove_btn.config(state=tk.DISABLED)
-            self.save_individual_btn.config(state=tk.DISABLED)
-            self.rename_btn.config(state=tk.DISABLED)
+            self._set_btns(tk.DISABLED)
             
     def remove_selected_crop(self):
         """Remove the currently selected crop"""
+        crop_index = self._current_crop_index()
+        if crop_index is not None:
+            self.app.remove_crop(crop_index)
+            
+    def _current_crop_index(self):
+        """Get the index of the selected crop, or None if no valid crop is selected"""
         selection = self.crop_listbox.curselection()
-        if selection:
-            crop_index = selection[0]
-            if crop_index < len(self.app.crop_selections):
-                self.app.remove_crop(crop_index)
+        if selection and selection[0] < len(self.app.crop_selections):
+            return selection[0]
+        return None
                 
     def clear_all_crops(self):
         """Clear all crop selections"""
@@ -182,12 +369,10 @@ class CropFrame(ttk.LabelFrame):
         
     def save_selected_crop(self):
         """Save the currently selected individual crop"""
-        selection = self.crop_listbox.curselection()
-        if selection:
-            crop_index = selection[0]
-            if crop_index < len(self.app.crop_selections):
-                # Show quality preview before saving
-                self.show_crop_quality_preview(crop_index)
+        crop_index = self._current_crop_index()
+        if crop_index is not None:
+            # Show quality preview before saving
+            self.show_crop_quality_preview(crop_index)
                 
     def show_crop_quality_preview(self, crop_index):
         """Show detailed quality information before saving"""
@@ -197,11 +382,7 @@ class CropFrame(ttk.LabelFrame):
         crop = self.app.crop_selections[crop_index]
         
         try:
-            from image_extractor import ImageExtractor
-            import tkinter.messagebox as messagebox
-            
-            extractor = ImageExtractor(self.app.pdf_document)
-            preview_info = extractor.get_crop_preview_info(crop)
+            preview_info = self._get_preview_info(crop)
             
             if preview_info:
                 details = (f"Quality Preview for Crop #{crop_index + 1}\n\n"
@@ -237,7 +418,6 @@ class CropFrame(ttk.LabelFrame):
             prev_name = prev_crop.get('custom_name', '')
             
             if prev_name:
-                import re
                 # Find the last number in the name
                 # This pattern finds all numbers in the name
                 numbers = re.findall(r'\d+', prev_name)
@@ -262,36 +442,22 @@ class CropFrame(ttk.LabelFrame):
             
     def rename_selected_crop(self):
         """Rename the currently selected crop"""
-        selection = self.crop_listbox.curselection()
-        if selection:
-            crop_index = selection[0]
-            if crop_index < len(self.app.crop_selections):
-                self.show_rename_dialog(crop_index)
+        crop_index = self._current_crop_index()
+        if crop_index is not None:
+            self.show_rename_dialog(crop_index)
                 
     def show_rename_dialog(self, crop_index):
         """Show streamlined rename dialog with improved UX"""
         crop = self.app.crop_selections[crop_index]
         current_name = crop.get('custom_name', f"crop_{crop_index + 1:02d}")
         
-        # Create compact rename dialog
-        dialog = tk.Toplevel(self.app.root)
-        dialog.title("Rename Crop")
-        dialog.geometry("400x120")
-        dialog.resizable(False, False)
-        dialog.transient(self.app.root)
-        dialog.grab_set()
+        # The dialog is built once, then hidden and shown again for each rename
+        if self._rename_dialog is None:
+            self._build_rename_dialog()
+        self._rename_crop_index = crop_index
+        self._rename_current_name = current_name
         
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-        
-        # Dialog content with tighter layout
-        main_frame = ttk.Frame(dialog, padding=15)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        ttk.Label(main_frame, text=f"Crop #{crop_index + 1} name:").pack(anchor=tk.W, pady=(0, 5))
+        self._rename_label.config(text=f"Crop #{crop_index + 1} name:")
         
         # Get smart default name for new crops
         smart_default_name = self.get_smart_default_name(crop_index)
@@ -301,81 +467,119 @@ class CropFrame(ttk.LabelFrame):
         if crop_index == len(self.app.crop_selections) - 1 and smart_default_name:
             initial_value = smart_default_name
         
-        name_var = tk.StringVar(value=initial_value)
-        name_entry = ttk.Entry(main_frame, textvariable=name_var, width=40, font=("TkDefaultFont", 10))
-        name_entry.pack(fill=tk.X, pady=(0, 10))
+        self._rename_name_var.set(initial_value)
         
         # Auto-select the part that's most likely to be changed (everything after the filename)
+        name_entry = self._rename_entry
+        name_entry.selection_clear()
         if "_Q" in current_name:
             # Select from _Q onwards for easy replacement
             start_pos = current_name.find("_Q")
             name_entry.select_range(start_pos, tk.END)
         else:
             name_entry.select_range(0, tk.END)
+        
+        self._rename_dialog.deiconify()
+        self._rename_dialog.grab_set()
         name_entry.focus()
         
+    def _build_rename_dialog(self):
+        """Create the rename dialog widgets, initially hidden"""
+        # Create compact rename dialog
+        dialog = tk.Toplevel(self.app.root)
+        dialog.withdraw()
+        dialog.title("Rename Crop")
+        
+        # Size and center the dialog in one step
+        screen_width = dialog.winfo_screenwidth()
+        screen_height = dialog.winfo_screenheight()
+        dialog.geometry(f"400x120+{(screen_width - 400) // 2}+{(screen_height - 120) // 2}")
+        dialog.resizable(False, False)
+        dialog.transient(self.app.root)
+        
+        # Dialog content with tighter layout
+        main_frame = ttk.Frame(dialog, padding=15)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self._rename_label = ttk.Label(main_frame)
+        self._rename_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        self._rename_name_var = tk.StringVar()
+        self._rename_entry = ttk.Entry(main_frame, textvariable=self._rename_name_var, width=40,
+                                       font=("TkDefaultFont", 10))
+        self._rename_entry.pack(fill=tk.X, pady=(0, 10))
+        
         # Buttons in compact layout
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
         
-        def save_name():
-            new_name = name_var.get().strip()
-            if new_name and new_name != current_name:
-                # Check for duplicate names and append number if needed
-                existing_names = [crop.get('custom_name', '') for i, crop in enumerate(self.app.crop_selections) if i != crop_index]
-                
-                if new_name in existing_names:
-                    # Find a unique name by appending a number
-                    base_name = new_name
-                    counter = 2
-                    while new_name in existing_names:
-                        new_name = f"{base_name}_{counter}"
-                        counter += 1
-                    
-                    # Ask user for confirmation of the new name
-                    response = messagebox.askyesno("Duplicate Name", 
-                        f"Name '{base_name}' already exists.\n\nUse suggested name '{new_name}' instead?")
-                    
-                    if not response:
-                        # User declined, remove the crop entirely
-                        dialog.destroy()
-                        self.app.remove_crop(crop_index)
-                        return
-                    # If user accepted, continue with new_name
-                
-                # Learn from the rename pattern
-                self.app.learn_from_rename(crop_index, current_name, new_name)
-                
-                # Update the crop name
-                self.app.crop_selections[crop_index]['custom_name'] = new_name
-                self.update_crop_list(self.app.crop_selections)
-                
-                # Auto-scroll to show the renamed item
-                self.crop_listbox.see(crop_index)
-                
-            dialog.destroy()
-            
-        def cancel():
-            dialog.destroy()
-            
         # Handle Enter and Escape keys
         def on_enter(event):
-            save_name()
+            self._save_rename()
             
         def on_escape(event):
-            cancel()
+            self._close_rename_dialog()
             
-        name_entry.bind('<Return>', on_enter)
+        self._rename_entry.bind('<Return>', on_enter)
         dialog.bind('<Escape>', on_escape)
         
         # Compact button layout
-        ttk.Button(button_frame, text="Cancel", command=cancel).pack(side=tk.RIGHT, padx=(5, 0))
-        save_btn = ttk.Button(button_frame, text="Save", command=save_name)
+        ttk.Button(button_frame, text="Cancel", command=self._close_rename_dialog).pack(side=tk.RIGHT, padx=(5, 0))
+        save_btn = ttk.Button(button_frame, text="Save", command=self._save_rename)
         save_btn.pack(side=tk.RIGHT)
         
         # Make Save button default
         dialog.bind('<Return>', on_enter)
         
+        # Closing the window hides it for reuse
+        dialog.protocol("WM_DELETE_WINDOW", self._close_rename_dialog)
+        self._rename_dialog = dialog
+        
+    def _close_rename_dialog(self):
+        """Hide the rename dialog until the next rename"""
+        self._rename_dialog.grab_release()
+        self._rename_dialog.withdraw()
+        
+    def _save_rename(self):
+        """Apply the name entered in the rename dialog"""
+        crop_index = self._rename_crop_index
+        current_name = self._rename_current_name
+        new_name = self._rename_name_var.get().strip()
+        if new_name and new_name != current_name:
+            # Check for duplicate names and append number if needed
+            existing_names = [crop.get('custom_name', '') for i, crop in enumerate(self.app.crop_selections) if i != crop_index]
+            
+            if new_name in existing_names:
+                # Find a unique name by appending a number
+                base_name = new_name
+                counter = 2
+                while new_name in existing_names:
+                    new_name = f"{base_name}_{counter}"
+                    counter += 1
+                
+                # Ask user for confirmation of the new name
+                response = messagebox.askyesno("Duplicate Name", 
+                    f"Name '{base_name}' already exists.\n\nUse suggested name '{new_name}' instead?")
+                
+                if not response:
+                    # User declined, remove the crop entirely
+                    self._close_rename_dialog()
+                    self.app.remove_crop(crop_index)
+                    return
+                # If user accepted, continue with new_name
+            
+            # Learn from the rename pattern
+            self.app.learn_from_rename(crop_index, current_name, new_name)
+            
+            # Update the crop name
+            self.app.crop_selections[crop_index]['custom_name'] = new_name
+            self.update_crop_names_range(self.app.crop_selections, crop_index, crop_index)
+            
+            # Auto-scroll to show the renamed item
+            self.crop_listbox.see(crop_index)
+            
+        self._close_rename_dialog()
+        
     def on_double_click_rename(self, event):
         """Handle immediate double-click to rename crop"""
         # Get the clicked item
@@ -396,12 +600,10 @@ class CropFrame(ttk.LabelFrame):
     def on_f2_rename(self, event):
         """Handle F2 key for renaming selected crop (Windows-style)"""
         # Check if the crop listbox has focus or if a crop is selected
-        selection = self.crop_listbox.curselection()
-        if selection:
-            crop_index = selection[0]
-            if crop_index < len(self.app.crop_selections):
-                self.show_rename_dialog(crop_index)
-                return "break"  # Prevent further event processing
+        crop_index = self._current_crop_index()
+        if crop_index is not None:
+            self.show_rename_dialog(crop_index)
+            return "break"  # Prevent further event processing
 
 class NamingFrame(ttk.LabelFrame):
     """Frame for configuring file naming patterns"""
@@ -409,6 +611,8 @@ class NamingFrame(ttk.LabelFrame):
     def __init__(self, parent, app):
         super().__init__(parent, text="File Naming", padding=10)
         self.app = app
+        self._last_pattern = None  # Pattern last passed to the app, to skip identical updates
+        self._pattern_after_id = None  # Pending application of a typed pattern
         self.setup_ui()
         
     def setup_ui(self):
@@ -461,8 +665,23 @@ class NamingFrame(ttk.LabelFrame):
                  foreground="gray", wraplength=200, justify=tk.LEFT).pack(pady=(5, 0))
         
     def on_pattern_change(self, *args):
-        """Handle pattern changes"""
+        """Handle pattern changes, applying them once a burst of keystrokes settles"""
+        if self._pattern_after_id:
+            self.after_cancel(self._pattern_after_id)
+            self._pattern_after_id = None
+            
+        # Writes of the pattern already applied (e.g. set_pattern with the current preset) need no update
+        if self.pattern_var.get() == self._last_pattern:
+            return
+        self._pattern_after_id = self.after(120, self._apply_pattern)
+        
+    def _apply_pattern(self):
+        """Pass the current pattern to the app and refresh the preview"""
+        self._pattern_after_id = None
         pattern = self.pattern_var.get()
+        if pattern == self._last_pattern:
+            return
+        self._last_pattern = pattern
         
         # Update app naming pattern
         self.app.update_naming_pattern(pattern)
@@ -481,28 +700,8 @@ class NamingFrame(ttk.LabelFrame):
         
     def update_preview(self, pattern):
         """Update the naming preview"""
-        try:
-            # Generate preview with sample numbers
-            samples = []
-            for i in range(1, 4):
-                try:
-                    filename = pattern.format(i)
-                    if not filename.endswith('.png'):
-                        filename += '.png'
-                    samples.append(filename)
-                except:
-                    samples.append("(invalid pattern)")
-                    break
-                    
-            if len(samples) == 3 and "(invalid pattern)" not in samples:
-                preview = f"{samples[0]}, {samples[1]}, ..."
-            else:
-                preview = samples[0] if samples else "(invalid pattern)"
-                
-            self.preview_label.config(text=preview, foreground="gray" if "(invalid" not in preview else "red")
-            
-        except Exception:
-            self.preview_label.config(text="(invalid pattern)", foreground="red")
+        text, color = _compute_preview(pattern)
+        self.preview_label.config(text=text, foreground=color)
             
     def set_pattern(self, pattern):
         """Set a preset naming pattern"""
@@ -549,8 +748,8 @@ class ControlFrame(ttk.Frame):
             "Click+Drag: Select crop"
         ]
         
-        for shortcut in shortcuts:
-            ttk.Label(help_frame, text=shortcut, font=("Arial", 9)).pack(anchor=tk.W, pady=1)
+        ttk.Label(help_frame, text="\n".join(shortcuts), font=("Arial", 9),
+                 justify=tk.LEFT).pack(anchor=tk.W)
 
 class StatusBar(ttk.Frame):
     """Status bar component"""
@@ -2,12 +2,112 @@
 Utility Functions - Helper functions for the PDF viewer application
 """
 
+import atexit
 import os
-import tkinter as tk
+import string
+import threading
+from functools import lru_cache
 from pathlib import Path
-import fitz  # PyMuPDF
+from types import MappingProxyType
 from datetime import datetime
 
+# File size units and the factor converting bytes to each
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_RECIPROCALS = tuple(1.0 / (1 << (10 * i)) for i in range(len(_SIZE_UNITS)))
+
+# PDF metadata keys shown in the info panel, with their labels
+_META_FIELDS = (
+    ('title', 'Title'),
+    ('author', 'Author'),
+    ('subject', 'Subject'),
+    ('creator', 'Creator'),
+    ('producer', 'Producer'),
+)
+
+# Characters not allowed in file names on Windows
+_INVALID_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+
+class UniqueNamer:
+    """
+    Hand out unique file names in one directory from a single directory listing
+    
+    Every name handed out is reserved, so threads naming files for the same
+    directory never get the same name. Existing entries count as taken even if
+    they are broken symlinks. Names are only suggestions: callers writing
+    concurrently with other processes must still create the file exclusively.
+    """
+    
+    def __init__(self, directory, existing_names=None):
+        """
+        Args:
+            directory: Directory the names are for
+            existing_names: Normcased names known to be taken, instead of listing the directory
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._listed = True  # False if the directory could not be listed and names are checked one by one
+        
+        # Read the directory once instead of a stat per candidate (normcase matches Windows' case-insensitive names)
+        if existing_names is not None:
+            self._taken = set(existing_names)
+            return
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                self._taken = {os.path.normcase(entry.name) for entry in entries}
+        except FileNotFoundError:
+            self._taken = set()
+        except OSError:
+            self._taken = set()
+            self._listed = False
+            
+    def _is_taken(self, name):
+        """Check whether a name is already used or handed out"""
+        if os.path.normcase(name) in self._taken:
+            return True
+        return not self._listed and os.path.lexists(os.path.join(self.directory, name))
+        
+    def reserve_name(self, name):
+        """
+        Reserve a file name, appending a number if it is taken
+        
+        Args:
+            name: Desired file name
+            
+        Returns:
+            str: The reserved file name
+        """
+        with self._lock:
+            if self._is_taken(name):
+                # Find a free number in O(log N) probes: double until one is free, then bisect
+                # the gap for the first free number after the last taken one. Numbers follow each
+                # other without gaps in practice, so this is normally the lowest free number.
+                stem, suffix = os.path.splitext(name)
+                numbered = lambda counter: f"{stem}_{counter}{suffix}"
+                low, high = 1, 2
+                while self._is_taken(numbered(high)):
+                    low, high = high, high * 2
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._is_taken(numbered(middle)):
+                        low = middle
+                    else:
+                        high = middle
+                name = numbered(high)
+            self._taken.add(os.path.normcase(name))
+            return name
+            
+    def reserve(self, name):
+        """
+        Reserve a file name, appending a number if it is taken
+        
+        Args:
+            name: Desired file name
+            
+        Returns:
+            str: Full path of the reserved file
+        """
+        return os.path.join(self.directory, self.reserve_name(name))
+
 def get_unique_filename(filepath):
     """
     Get a unique filename by appending a number if the file already exists.
@@ -18,22 +118,11 @@ def get_unique_filename(filepath):
     Returns:
         str: Unique file path
     """
-    if not os.path.exists(filepath):
+    directory, name = os.path.split(os.fspath(filepath))
+    unique_name = UniqueNamer(directory).reserve_name(name)
+    if unique_name == name:
         return filepath
-    
-    # Split into base and extension
-    path = Path(filepath)
-    directory = path.parent
-    stem = path.stem
-    suffix = path.suffix
-    
-    # Try adding numbers until we find one that doesn't exist
-    counter = 2
-    while True:
-        new_path = directory / f"{stem}_{counter}{suffix}"
-        if not new_path.exists():
-            return str(new_path)
-        counter += 1
+    return os.path.join(directory, unique_name)
 
 def format_file_size(size_bytes):
     """
@@ -48,28 +137,26 @@ def format_file_size(size_bytes):
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-        
-    return f"{size_bytes:.1f} {size_names[i]}"
+    # Each unit spans 10 bits of the size
+    i = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes * _SIZE_RECIPROCALS[i]:.1f} {_SIZE_UNITS[i]}"
 
-def get_pdf_info(pdf_document, file_path):
+def get_pdf_info(pdf_document, file_path, file_stat=None):
     """
     Get comprehensive information about a PDF document
     
     Args:
         pdf_document: PyMuPDF document object
         file_path: Path to the PDF file
+        file_stat: os.stat result of file_path, if the caller already has one
         
     Returns:
         str: Formatted PDF information
     """
     try:
         # Basic file information
-        file_stat = os.stat(file_path)
+        if file_stat is None:
+            file_stat = os.stat(file_path)
         file_size = format_file_size(file_stat.st_size)
         mod_time = datetime.fromtimestamp(file_stat.st_mtime).strftime("%Y-%m-%d %H:%M")
         
@@ -80,10 +167,8 @@ def get_pdf_info(pdf_document, file_path):
         page_count = len(pdf_document)
         
         # Get first page dimensions for reference
-        first_page = pdf_document[0]
-        page_rect = first_page.rect
-        page_width_pt = page_rect.width
-        page_height_pt = page_rect.height
+        page_rect = pdf_document[0].rect
+        page_width_pt, page_height_pt = page_rect.width, page_rect.height
         page_width_in = page_width_pt / 72
         page_height_in = page_height_pt / 72
         
@@ -99,22 +184,13 @@ def get_pdf_info(pdf_document, file_path):
             f"Pages: {page_count}",
             f"Encrypted: {'Yes' if is_encrypted else 'No'}",
             "",
-            f"Page Size: {page_width_pt:.0f} × {page_height_pt:.0f} pt",
-            f"({page_width_in:.1f}\" × {page_height_in:.1f}\")",
+            f"Page Size: {page_width_pt:.0f} × {page_height_pt:.0f} pt ({page_width_in:.1f}\" × {page_height_in:.1f}\")",
             "",
         ]
         
         # Add metadata if available
-        if metadata.get('title'):
-            info_lines.append(f"Title: {metadata['title']}")
-        if metadata.get('author'):
-            info_lines.append(f"Author: {metadata['author']}")
-        if metadata.get('subject'):
-            info_lines.append(f"Subject: {metadata['subject']}")
-        if metadata.get('creator'):
-            info_lines.append(f"Creator: {metadata['creator']}")
-        if metadata.get('producer'):
-            info_lines.append(f"Producer: {metadata['producer']}")
+        if metadata:
+            info_lines.extend(f"{label}: {value}" for key, label in _META_FIELDS if (value := metadata.get(key)))
             
         return "\n".join(info_lines)
         
@@ -131,27 +207,56 @@ def validate_naming_pattern(pattern):
     Returns:
         tuple: (is_valid, error_message)
     """
+    # Test the pattern with sample numbers; only formatting can raise
     try:
-        # Test the pattern with a sample number
-        test_filename = pattern.format(1)
-        
-        # Check for invalid filename characters
-        invalid_chars = '<>:"/\\|?*'
-        if any(char in test_filename for char in invalid_chars):
-            return False, "Pattern contains invalid filename characters"
-            
-        # Check if pattern produces different names
         name1 = pattern.format(1)
         name2 = pattern.format(2)
-        if name1 == name2:
-            return False, "Pattern does not differentiate between numbers"
-            
-        return True, ""
-        
     except (ValueError, KeyError) as e:
         return False, f"Invalid pattern format: {str(e)}"
     except Exception as e:
         return False, f"Pattern error: {str(e)}"
+        
+    # Check for invalid filename characters
+    if not _INVALID_FILENAME_CHARS.isdisjoint(name1):
+        return False, "Pattern contains invalid filename characters"
+        
+    # Check if pattern produces different names
+    if name1 == name2:
+        return False, "Pattern does not differentiate between numbers"
+        
+    return True, ""
+
+@lru_cache(maxsize=64)
+def compile_naming_pattern(pattern):
+    """
+    Compile a file naming pattern into a function that formats one number
+    
+    Patterns with a single positional field, such as "Q{:02d}", are split once
+    into literal text and format spec, so each name skips re-parsing the pattern.
+    
+    Args:
+        pattern: The naming pattern string
+        
+    Returns:
+        callable: Function mapping a number to a name, or None if the pattern is invalid
+    """
+    try:
+        parts = list(string.Formatter().parse(pattern))
+        pattern.format(1)
+    except Exception:
+        return None
+        
+    field_indexes = [i for i, part in enumerate(parts) if part[1] is not None]
+    if len(field_indexes) != 1:
+        return pattern.format
+    index = field_indexes[0]
+    _, field_name, format_spec, conversion = parts[index]
+    if field_name not in ('', '0') or conversion or '{' in format_spec:
+        return pattern.format
+        
+    prefix = ''.join(part[0] for part in parts[:index + 1])
+    suffix = ''.join(part[0] for part in parts[index + 1:])
+    return lambda number: prefix + format(number, format_spec) + suffix
 
 def ensure_directory_exists(directory_path):
     """
@@ -164,12 +269,22 @@ def ensure_directory_exists(directory_path):
         bool: True if directory exists or was created successfully
     """
     try:
-        Path(directory_path).mkdir(parents=True, exist_ok=True)
+        _make_dirs(directory_path)
         return True
     except Exception as e:
-        print(f"Error creating directory {directory_path}: {str(e)}")
+        log_error(f"Error creating directory {directory_path}: {str(e)}", "Directory")
         return False
 
+# Directories this process already created or found, so repeated calls skip the filesystem
+_known_dirs = set()
+
+def _make_dirs(directory_path):
+    """Create a directory and its parents once per process, raising OSError on failure"""
+    directory_path = os.fspath(directory_path)
+    if directory_path not in _known_dirs:
+        os.makedirs(directory_path, exist_ok=True)
+        _known_dirs.add(directory_path)
+
 # Removed duplicate get_unique_filename function - using the one at line 11
 
 def calculate_crop_dpi(crop_coords, zoom_level, target_pixels=1920):
@@ -186,32 +301,31 @@ def calculate_crop_dpi(crop_coords, zoom_level, target_pixels=1920):
     """
     crop_width_display = crop_coords[2] - crop_coords[0]
     
-    # Convert to PDF points (accounting for zoom and display scaling)
-    crop_width_points = crop_width_display / zoom_level
-    crop_width_inches = crop_width_points / 72
-    
-    # Calculate DPI needed for target pixel width
-    if crop_width_inches > 0:
-        recommended_dpi = target_pixels / crop_width_inches
-        return min(int(recommended_dpi), 600)  # Cap at reasonable maximum
+    # DPI needed for target pixel width: target_pixels / (width / zoom / 72 points per inch),
+    # folded into a single division
+    if crop_width_display > 0:
+        return min(int(target_pixels * 72 * zoom_level / crop_width_display), 600)  # Cap at reasonable maximum
     
-    return 300  # Default DPI
+    return 300  # Default DPI for empty selections
+
+# Supported export formats, built once; read-only so the shared value cannot be changed
+_SUPPORTED_FORMATS = (
+    MappingProxyType({
+        'name': 'PNG (Lossless)',
+        'extension': '.png',
+        'description': 'Preserves exact DPI and quality without compression artifacts',
+        'mime_type': 'image/png'
+    }),
+)
 
 def get_supported_formats():
     """
-    Get list of supported export formats - PNG only for lossless quality preservation
+    Get supported export formats - PNG only for lossless quality preservation
     
     Returns:
-        list: List of format dictionaries
+        tuple: Read-only format mappings
     """
-    return [
-        {
-            'name': 'PNG (Lossless)',
-            'extension': '.png',
-            'description': 'Preserves exact DPI and quality without compression artifacts',
-            'mime_type': 'image/png'
-        }
-    ]
+    return _SUPPORTED_FORMATS
 
 def create_desktop_shortcut(app_path, shortcut_path):
     """
@@ -225,9 +339,7 @@ def create_desktop_shortcut(app_path, shortcut_path):
         bool: True if shortcut was created successfully
     """
     try:
-        import win32com.client
-        
-        shell = win32com.client.Dispatch("WScript.Shell")
+        shell = _get_wscript_shell()
         shortcut = shell.CreateShortCut(shortcut_path)
         shortcut.Targetpath = app_path
         shortcut.WindowStyle = 1  # Normal window
@@ -243,6 +355,19 @@ def create_desktop_shortcut(app_path, shortcut_path):
         print(f"Error creating shortcut: {str(e)}")
         return False
 
+# WScript.Shell COM objects, one per thread since COM objects belong to the thread that created them
+_com_objects = threading.local()
+
+def _get_wscript_shell():
+    """Get this thread's WScript.Shell object, creating it on first use (raises ImportError without pywin32)"""
+    shell = getattr(_com_objects, 'wscript_shell', None)
+    if shell is None:
+        import win32com.client
+        
+        shell = win32com.client.Dispatch("WScript.Shell")
+        _com_objects.wscript_shell = shell
+    return shell
+
 def get_system_info():
     """
     Get system information for troubleshooting
@@ -250,8 +375,15 @@ def get_system_info():
     Returns:
         dict: System information
     """
+    return dict(_get_system_info())
+
+@lru_cache(maxsize=1)
+def _get_system_info():
+    """Collect system information once per process (platform queries may spawn subprocesses)"""
     import platform
     import sys
+    import tkinter as tk
+    import fitz  # PyMuPDF
     
     return {
         'platform': platform.platform(),
@@ -261,6 +393,10 @@ def get_system_info():
         'pymupdf_version': getattr(fitz, '__version__', 'Unknown')
     }
 
+# Error log file kept open for the day it belongs to, shared by all threads
+_log_state = {'day': None, 'file': None}
+_log_lock = threading.Lock()
+
 def log_error(error_msg, error_type="General"):
     """
     Log error to file for debugging
@@ -270,17 +406,32 @@ def log_error(error_msg, error_type="General"):
         error_type: Type of error
     """
     try:
-        log_dir = Path.home() / "PDFExtractor_Logs"
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f"error_log_{datetime.now().strftime('%Y%m%d')}.txt"
+        now = datetime.now()
+        day = now.toordinal()
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {error_type}: {error_msg}\n"
-        
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        with _log_lock:
+            # Open the day's log once, switching files when the date changes
+            if day != _log_state['day']:
+                _close_log_file()
+                log_dir = Path.home() / "PDFExtractor_Logs"
+                _make_dirs(log_dir)
+                _log_state['file'] = open(log_dir / f"error_log_{now.strftime('%Y%m%d')}.txt", 'a',
+                                          encoding='utf-8', buffering=1)
+                _log_state['day'] = day
+                
+            timestamp = now.isoformat(sep=' ', timespec='seconds')
+            _log_state['file'].write(f"[{timestamp}] {error_type}: {error_msg}\n")
             
     except Exception:
         # If logging fails, just ignore it
         pass
+
+def _close_log_file():
+    """Close the open error log file, if any"""
+    log_file = _log_state['file']
+    _log_state['file'] = None
+    _log_state['day'] = None
+    if log_file:
+        log_file.close()
+
+atexit.register(_close_log_file)